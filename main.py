@@ -53,6 +53,7 @@ logger = logging.getLogger("sol-screener")
 
 # ── モジュールインポート ──
 from src.config import config
+from src.fetch import create_session
 from src.scanner import DexScreenerScanner
 from src.scorer import Scorer
 from src.notifier import Notifier
@@ -106,8 +107,8 @@ async def init():
     global tge_monitor, nft_floor_monitor, meme_monitor
     global airdrop_scanner, nft_monitor, x_monitor, discord_bot
 
-    timeout = aiohttp.ClientTimeout(total=30)
-    session = aiohttp.ClientSession(timeout=timeout)
+    # 全モジュールで1つのセッション/コネクタを共有（Keep-Alive + DNSキャッシュ）
+    session = create_session()
 
     scanner = DexScreenerScanner(session)
     scorer = Scorer()
@@ -544,6 +545,10 @@ async def run_full_scan():
 # ============================================================
 # エアドロップスキャン（1日2回: 9時/21時 JST）
 # ============================================================
+# BCG/ゲーム枠に入れるカテゴリ
+AIRDROP_GAME_CATEGORIES = frozenset({"gamefi", "bcg", "gaming", "nft"})
+
+
 async def run_airdrop_scan():
     """エアドロップ情報を複数ソースから収集してDiscordに通知"""
     logger.info("✈️ エアドロップスキャン開始...")
@@ -555,26 +560,32 @@ async def run_airdrop_scan():
             logger.info("エアドロップ情報なし")
             return
 
-        high_conf = airdrop_scanner.filter_by_confidence(all_airdrops, min_confidence=40)
+        # 確度フィルタ → 通知済み除外 → BCG/ゲーム枠の振り分けを1パスで
+        high_conf_count = 0
+        fresh_count = 0
+        gamefi: list = []
+        others: list = []
+        for a in all_airdrops:
+            if a.confidence < 40:
+                continue
+            high_conf_count += 1
+            airdrop_key = f"airdrop_{StateManager.normalize_key(a.name)}"
+            if state.is_notified(airdrop_key):
+                continue
+            fresh_count += 1
+            if a.category in AIRDROP_GAME_CATEGORIES:
+                gamefi.append(a)
+            else:
+                others.append(a)
 
-        if not high_conf:
+        if not high_conf_count:
             logger.info(f"エアドロ検出 {len(all_airdrops)}件、確度40%以上: 0件 → 通知スキップ")
             return
 
-        fresh = []
-        for a in high_conf:
-            airdrop_key = f"airdrop_{StateManager.normalize_key(a.name)}"
-            if not state.is_notified(airdrop_key):
-                fresh.append(a)
-
-        if not fresh:
-            logger.info(f"エアドロ {len(high_conf)}件全て通知済み → 新規なし、スキップ")
+        if not fresh_count:
+            logger.info(f"エアドロ {high_conf_count}件全て通知済み → 新規なし、スキップ")
             return
 
-        # BCG/ゲーム枠を確保
-        gamefi = [a for a in fresh if a.category in ('gamefi', 'bcg', 'gaming', 'nft')]
-        others = [a for a in fresh if a.category not in ('gamefi', 'bcg', 'gaming', 'nft')]
-
         game_top = airdrop_scanner.get_top(gamefi, n=5) if gamefi else []
         other_top = airdrop_scanner.get_top(others, n=20 - len(game_top))
         top_airdrops = game_top + other_top
@@ -585,7 +596,7 @@ async def run_airdrop_scan():
 
         logger.info(
             f"✈️ エアドロ通知: {len(top_airdrops)}件 "
-            f"(全{len(all_airdrops)}件 → 確度40%+: {len(high_conf)}件 → 新規: {len(fresh)}件 → "
+            f"(全{len(all_airdrops)}件 → 確度40%+: {high_conf_count}件 → 新規: {fresh_count}件 → "
             f"BCG枠: {len(game_top)}件 + 他: {len(other_top)}件)"
         )
 
@@ -19,27 +19,53 @@
   - 新規プロジェクト（Raises）を優先表示
 """
 import asyncio
+import heapq
 import json
 import logging
 import os
+import re
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Optional
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Optional
 
 import aiohttp
 
+from .fetch import HostLimiter, TTLCache, raise_for_retry, read_json, with_retry
+
+# ijson はオプション依存（未インストール時は一括デコードにフォールバック）
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError:
     BeautifulSoup = None
+    SoupStrainer = None
 
 logger = logging.getLogger(__name__)
 
 # ── 通知済みエアドロ記憶ファイル ──
 AIRDROP_STATE_FILE = os.getenv("AIRDROP_STATE_FILE", "data/airdrop_state.json")
 
+DEFILLAMA_PROTOCOLS_URL = "https://api.llama.fi/protocols"
+
+# ── HTTPタイムアウト: 全体の上限に加え、接続とソケット読み取りも個別に制限 ──
+# （リクエスト単位の timeout はセッションの total=30 を置き換えるので total も必ず指定する）
+SOURCE_TIMEOUT = aiohttp.ClientTimeout(total=15, sock_connect=5, sock_read=10)
+# DeFiLlama /protocols はボディが大きい（ストリーミングで読む）ので全体上限だけ広げる
+PROTOCOLS_TIMEOUT = aiohttp.ClientTimeout(total=60, sock_connect=5, sock_read=10)
+
+# ── AirdropAlert: カード要素（class に airdrop/card を含む）のサブツリーだけをパース ──
+_AIRDROPALERT_STRAINER = (
+    SoupStrainer(class_=re.compile(r"airdrop|card")) if SoupStrainer else None
+)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AirdropInfo:
     """エアドロップ情報"""
     name: str
@@ -57,16 +83,53 @@ class AirdropInfo:
     is_new: bool = False  # 新規検出フラグ
 
 
+@dataclass(slots=True)
+class DefiLlamaProtocol:
+    """DeFiLlama /protocols の1行（使うフィールドだけを一度だけパース）"""
+    name: str
+    category: str
+    tvl: float
+    gecko_id: Optional[str]
+    chains: list[str]
+    slug: str
+    name_lower: str
+    category_lower: str
+    chains_lower: frozenset[str]
+
+    @classmethod
+    def from_dict(cls, p: dict) -> "DefiLlamaProtocol":
+        name = p.get("name", "") or ""
+        category = p.get("category", "") or ""
+        chains = p.get("chains", []) or []
+        return cls(
+            name=name,
+            category=category,
+            tvl=p.get("tvl", 0) or 0,
+            gecko_id=p.get("gecko_id"),
+            chains=chains,
+            slug=p.get("slug") or name.lower().replace(" ", "-"),
+            name_lower=name.lower(),
+            category_lower=category.lower(),
+            chains_lower=frozenset(c.lower() for c in chains),
+        )
+
+
+def _parse_protocols(data: Any) -> list[DefiLlamaProtocol]:
+    if not isinstance(data, list):
+        return []
+    return [DefiLlamaProtocol.from_dict(p) for p in data if isinstance(p, dict)]
+
+
 class AirdropScanner:
     """マルチチェーン対応エアドロップスキャナー"""
 
     # ── CEX / ブリッジ / 除外リスト ──
-    EXCLUDE_CATEGORIES = {
+    EXCLUDE_CATEGORIES = frozenset({
         "CEX", "cex", "Exchange", "exchange",
         "Bridge", "bridge", "Cross Chain", "cross chain",
-    }
+    })
 
-    EXCLUDE_NAMES = {
+    EXCLUDE_NAMES = frozenset({
         "binance", "okx", "bybit", "coinbase", "kraken", "bitfinex",
         "kucoin", "gate.io", "htx", "huobi", "mexc", "bitget",
         "crypto.com", "robinhood", "upbit", "bithumb", "gemini",
@@ -77,7 +140,7 @@ class AirdropScanner:
         "celer", "hop protocol", "stargate bridge",
         "tether", "usdt", "usdc", "circle", "dai", "makerdao maker",
         "frax", "fei protocol", "rai",
-    }
+    })
 
     # ── Nitter インスタンス ──
     NITTER_INSTANCES = [
@@ -85,15 +148,63 @@ class AirdropScanner:
         "https://nitter.privacydev.net",
     ]
 
-    AIRDROP_KEYWORDS = [
+    AIRDROP_KEYWORDS = (
         "airdrop", "エアドロ", "token launch", "claim",
         "points", "season", "testnet", "incentive",
         "retroactive", "retrodrop", "farming",
-    ]
+    )
+
+    # ── DeFiLlama カテゴリ / キーワード（ループ外で一度だけ構築） ──
+    GAMEFI_CATEGORIES = frozenset({"Gaming", "GameFi", "Metaverse", "Play-to-Earn"})
+
+    # チェーン判定の優先順位
+    DEFI_CHAIN_PRIORITY = ("solana", "ethereum", "arbitrum", "base", "bsc")
+    GAMEFI_CHAIN_PRIORITY = ("solana", "ethereum")
+    RAISE_CHAIN_PRIORITY = ("solana", "ethereum", "arbitrum", "base")
+
+    # Raises カテゴリ判定（小文字の部分一致、上から優先）
+    RAISE_CATEGORY_KEYWORDS = (
+        ("gamefi", ("game", "gaming", "metaverse")),
+        ("nft", ("nft", "collectible")),
+        ("infra", ("infra", "tool", "analytics")),
+        ("l2", ("l1", "l2", "chain", "rollup")),
+    )
+
+    # 有名VC（小文字の部分一致）
+    TOP_VCS = (
+        "a16z", "paradigm", "sequoia", "polychain", "multicoin",
+        "binance labs", "coinbase ventures", "dragonfly",
+    )
+
+    # ── format_summary 用の絵文字 ──
+    CHAIN_EMOJI = {
+        "solana": "◎", "ethereum": "⟠", "arbitrum": "🔵",
+        "base": "🔷", "optimism": "🔴", "polygon": "💜",
+        "bsc": "🟡", "sui": "💧", "berachain": "🐻",
+        "monad": "🟣", "scroll": "📜", "linea": "🌐",
+        "blast": "💥", "multi": "🌍", "avalanche": "🔺",
+        "ronin": "⚔️", "cosmos": "⚛️", "celestia": "🟣",
+    }
+
+    CATEGORY_EMOJI = {
+        "defi": "💰", "gamefi": "🎮", "nft": "🖼️",
+        "infra": "🔧", "social": "💬", "l2": "⛓️", "other": "📦",
+    }
+
+    # 確度バー: (確度>=50) + (確度>=70) で引く
+    CONFIDENCE_BARS = ("🔴", "🟡", "🟢")
+
+    # ── レスポンスキャッシュTTL（秒） ──
+    DEFILLAMA_CACHE_TTL = 1800  # protocols / raises は数時間単位でしか変わらない
+    COINGECKO_CACHE_TTL = 300
 
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
         self._notified_airdrops: dict[str, float] = {}  # name -> timestamp
+        self._json_cache = TTLCache()  # url -> JSON
+        self._protocols_lock = asyncio.Lock()
+        # ホスト単位の同時リクエスト上限（全ソース共通）
+        self._host_limit = HostLimiter()
         self._load_airdrop_state()
 
     # ── 通知済み記憶の管理 ──
@@ -143,15 +254,85 @@ class AirdropScanner:
             logger.info(f"エアドロ通知履歴クリーンアップ: {before} → {len(self._notified_airdrops)}件")
 
     # ── 除外判定 ──
-    def _is_excluded(self, name: str, category: str = "") -> bool:
-        """CEX/ブリッジ/ラップドトークンを除外"""
-        name_lower = name.lower()
+    def _is_excluded(self, name: str, category: str = "",
+                     name_lower: Optional[str] = None) -> bool:
+        """CEX/ブリッジ/ラップドトークンを除外（小文字化済みの名前があれば name_lower で渡す）"""
+        if name_lower is None:
+            name_lower = name.lower()
         if any(ex in name_lower for ex in self.EXCLUDE_NAMES):
             return True
         if category in self.EXCLUDE_CATEGORIES:
             return True
         return False
 
+    # ── HTTP ──
+    async def _cached(self, key: str, ttl: float,
+                      loader: Callable[[], Awaitable[Any]]) -> Any:
+        """loader() の結果をキー単位でTTLキャッシュ（None はキャッシュしない）"""
+        return await self._json_cache.get_or_load(key, ttl, loader)
+
+    async def _cached_json(self, url: str, ttl: float = 300,
+                           parse: Optional[Callable[[Any], Any]] = None,
+                           **kwargs) -> Any:
+        """
+        冪等GETのJSONをURL単位でTTLキャッシュ
+        - parse を渡すとパース済みの結果をキャッシュする
+        - 一時的な失敗（429/5xx/接続エラー）は with_retry で再試行
+        - 200以外は None（キャッシュしない）
+        """
+        kwargs.setdefault("timeout", SOURCE_TIMEOUT)
+
+        async def _get():
+            async with self._host_limit(url):
+                async with self.session.get(url, **kwargs) as resp:
+                    raise_for_retry(resp)
+                    if resp.status != 200:
+                        return None
+                    data = await read_json(resp)
+            return parse(data) if parse else data
+
+        return await self._cached(url, ttl, lambda: with_retry(_get))
+
+    async def _fetch_protocols(self) -> Optional[list[DefiLlamaProtocol]]:
+        """
+        DeFiLlama /protocols を DefiLlamaProtocol のリストで取得（TTLキャッシュ）
+        ijson があればストリーミングでパースし、生ボディ・全dictツリーを保持しない
+        """
+        if ijson is None:
+            return await self._cached_json(
+                DEFILLAMA_PROTOCOLS_URL, ttl=self.DEFILLAMA_CACHE_TTL,
+                parse=_parse_protocols, timeout=PROTOCOLS_TIMEOUT,
+            )
+
+        async def _get():
+            async with self._host_limit(DEFILLAMA_PROTOCOLS_URL):
+                async with self.session.get(DEFILLAMA_PROTOCOLS_URL,
+                                            timeout=PROTOCOLS_TIMEOUT) as resp:
+                    raise_for_retry(resp)
+                    if resp.status != 200:
+                        return None
+                    return [
+                        DefiLlamaProtocol.from_dict(p)
+                        async for p in ijson.items_async(resp.content, "item", use_float=True)
+                        if isinstance(p, dict)
+                    ]
+
+        return await self._cached(
+            DEFILLAMA_PROTOCOLS_URL, self.DEFILLAMA_CACHE_TTL, lambda: with_retry(_get),
+        )
+
+    async def _get_text(self, url: str) -> Optional[str]:
+        """スクレイピング用GET（一時的な失敗は再試行、200以外は None）"""
+        async def _get():
+            async with self._host_limit(url):
+                async with self.session.get(url, timeout=SOURCE_TIMEOUT) as resp:
+                    raise_for_retry(resp)
+                    if resp.status != 200:
+                        return None
+                    return await resp.text()
+
+        return await with_retry(_get)
+
     # ============================================================
     # メインスキャン
     # ============================================================
@@ -159,187 +340,171 @@ class AirdropScanner:
         """全ソースから並列スキャン"""
         self.cleanup_old_notifications()
 
-        tasks = [
-            self._source_defillama_defi(),
-            self._source_defillama_gamefi(),
-            self._source_defillama_raises(),
-            self._source_coingecko(),
-            self._source_airdropalert(),
-            self._source_cryptototem(),
-            self._source_curated(),
-            self._source_exchange_news(),
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        all_airdrops = []
-        source_names = [
-            "DeFiLlama-DeFi", "DeFiLlama-GameFi", "DeFiLlama-Raises",
-            "CoinGecko", "AirdropAlert", "CryptoTotem",
-            "Curated", "ExchangeNews",
-        ]
-
-        for i, result in enumerate(results):
-            name = source_names[i] if i < len(source_names) else f"Source-{i}"
+        sources = {
+            "DeFiLlama-DeFi": self._source_defillama_defi(),
+            "DeFiLlama-GameFi": self._source_defillama_gamefi(),
+            "DeFiLlama-Raises": self._source_defillama_raises(),
+            "CoinGecko": self._source_coingecko(),
+            "AirdropAlert": self._source_airdropalert(),
+            "CryptoTotem": self._source_cryptototem(),
+            "Curated": self._source_curated(),
+            "ExchangeNews": self._source_exchange_news(),
+        }
+
+        async def _run(name: str, coro) -> tuple[str, object]:
+            try:
+                return name, await coro
+            except Exception as e:
+                return name, e
+
+        # 完了したソースから順に重複排除（最遅ソースの後ろに排除処理を積まない）
+        total = 0
+        # 名前キーの64bitハッシュ -> unique 内の位置
+        # （プロセス内だけで使うので組み込み hash() で十分。衝突確率は N≦10^5 で無視できる）
+        index: dict[int, int] = {}
+        unique: list[AirdropInfo] = []
+        for fut in asyncio.as_completed([_run(n, c) for n, c in sources.items()]):
+            name, result = await fut
             if isinstance(result, Exception):
                 logger.warning(f"ソース {name} エラー: {result}")
-            elif isinstance(result, list):
-                logger.info(f"ソース {name}: {len(result)}件")
-                all_airdrops.extend(result)
-
-        # 重複排除（名前ベース）
-        seen = {}
-        unique = []
-        for a in all_airdrops:
-            key = a.name.lower().strip()
-            if key not in seen:
-                seen[key] = a
-                unique.append(a)
-            else:
-                # より高い確度のものを採用
-                if a.confidence > seen[key].confidence:
-                    unique.remove(seen[key])
-                    seen[key] = a
+                continue
+            if not isinstance(result, list):
+                continue
+            logger.info(f"ソース {name}: {len(result)}件")
+            total += len(result)
+
+            for a in result:
+                key = hash(a.name.lower().strip())
+                pos = index.get(key)
+                if pos is None:
+                    index[key] = len(unique)
                     unique.append(a)
+                elif a.confidence > unique[pos].confidence:
+                    # より高い確度のものを採用
+                    unique[pos] = a
 
-        logger.info(f"エアドロ合計: {len(all_airdrops)}件 → 重複排除後: {len(unique)}件")
+        logger.info(f"エアドロ合計: {total}件 → 重複排除後: {len(unique)}件")
         return unique
 
     # ============================================================
-    # ソース 1: DeFiLlama (DeFi)
+    # ソース 1-2: DeFiLlama (DeFi / GameFi) — 1回の走査で両方を分類
     # ============================================================
+    async def _classified_protocols(self) -> tuple[list[AirdropInfo], list[AirdropInfo]]:
+        """
+        /protocols を1回だけ走査して (DeFi, GameFi) に分類（TTLキャッシュ）
+        DeFi/GameFi ソースは並列に呼ばれるため、ロックで取得・分類を1回にまとめる
+        """
+        async def _load():
+            protocols = await self._fetch_protocols()
+            return self._classify_protocols(protocols) if protocols else None
+
+        async with self._protocols_lock:
+            result = await self._cached(
+                "defillama:classified", self.DEFILLAMA_CACHE_TTL, _load,
+            )
+        return result or ([], [])
+
+    def _classify_protocols(
+        self, protocols: list[DefiLlamaProtocol],
+    ) -> tuple[list[AirdropInfo], list[AirdropInfo]]:
+        """DeFi / GameFi 判定を1パスで実施（トークン発行済み・名前除外の判定は共通）"""
+        defi: list[AirdropInfo] = []
+        gamefi: list[AirdropInfo] = []
+
+        for p in protocols:
+            if p.gecko_id and p.gecko_id != "-":
+                continue  # トークン発行済み
+            # DeFi: TVL $1M以上 & CEX/ブリッジ系カテゴリ以外 / GameFi: ゲーム系カテゴリ
+            is_defi = p.tvl >= 1_000_000 and p.category not in self.EXCLUDE_CATEGORIES
+            is_game = p.category in self.GAMEFI_CATEGORIES
+            if not (is_defi or is_game):
+                continue
+            if self._is_excluded(p.name, "", name_lower=p.name_lower):
+                continue
+
+            if is_defi:
+                defi.append(self._defi_airdrop(p))
+            if is_game:
+                gamefi.append(self._gamefi_airdrop(p))
+
+        return defi, gamefi
+
+    @staticmethod
+    def _detect_chain(chains_lower: frozenset[str], priority: tuple[str, ...]) -> str:
+        """priority 順に最初に含まれるチェーンを返す（なければ multi）"""
+        for chain in priority:
+            if chain in chains_lower:
+                return chain
+        return "multi"
+
+    def _defi_airdrop(self, p: DefiLlamaProtocol) -> AirdropInfo:
+        tvl = p.tvl
+
+        # 確度スコア計算
+        conf = 40
+        if tvl >= 1_000_000_000:
+            conf += 25
+        elif tvl >= 100_000_000:
+            conf += 20
+        elif tvl >= 10_000_000:
+            conf += 10
+
+        cat_lower = p.category_lower
+        if "dex" in cat_lower or "lending" in cat_lower:
+            conf += 5
+        if "liquid staking" in cat_lower:
+            conf += 8
+
+        return AirdropInfo(
+            name=p.name,
+            chain=self._detect_chain(p.chains_lower, self.DEFI_CHAIN_PRIORITY),
+            category="defi",
+            description=f"TVL: ${tvl/1e6:.1f}M | カテゴリ: {p.category} | チェーン: {', '.join(p.chains[:3])}",
+            url=f"https://defillama.com/protocol/{p.slug}",
+            status="speculative",
+            source="defillama-defi",
+            confidence=min(conf, 95),
+            tvl=tvl,
+        )
+
+    def _gamefi_airdrop(self, p: DefiLlamaProtocol) -> AirdropInfo:
+        tvl = p.tvl
+
+        conf = 45
+        if tvl >= 10_000_000:
+            conf += 15
+        elif tvl >= 1_000_000:
+            conf += 8
+
+        return AirdropInfo(
+            name=p.name,
+            chain=self._detect_chain(p.chains_lower, self.GAMEFI_CHAIN_PRIORITY),
+            category="gamefi",
+            description=f"GameFi | TVL: ${tvl/1e6:.1f}M | チェーン: {', '.join(p.chains[:3])}",
+            url=f"https://defillama.com/protocol/{p.slug}",
+            status="speculative",
+            source="defillama-gamefi",
+            confidence=min(conf, 90),
+            tvl=tvl,
+        )
+
     async def _source_defillama_defi(self) -> list[AirdropInfo]:
         """DeFiLlama: TVL上位 + トークン未発行のDeFiプロトコル"""
-        airdrops = []
         try:
-            url = "https://api.llama.fi/protocols"
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                if resp.status != 200:
-                    return airdrops
-                protocols = await resp.json()
-
-            for p in protocols:
-                name = p.get("name", "")
-                category = p.get("category", "")
-                tvl = p.get("tvl", 0) or 0
-                symbol = p.get("symbol", "")
-                gecko_id = p.get("gecko_id")
-                chains = p.get("chains", [])
-
-                # 除外フィルタ
-                if self._is_excluded(name, category):
-                    continue
-                if tvl < 1_000_000:  # TVL $1M未満は除外
-                    continue
-                if gecko_id and gecko_id != "-":
-                    continue  # トークン発行済み
-
-                # チェーン判定
-                chain = "multi"
-                if chains:
-                    chain_lower = [c.lower() for c in chains]
-                    if "solana" in chain_lower:
-                        chain = "solana"
-                    elif "ethereum" in chain_lower:
-                        chain = "ethereum"
-                    elif "arbitrum" in chain_lower:
-                        chain = "arbitrum"
-                    elif "base" in chain_lower:
-                        chain = "base"
-                    elif "bsc" in chain_lower:
-                        chain = "bsc"
-
-                # 確度スコア計算
-                conf = 40
-                if tvl >= 1_000_000_000:
-                    conf += 25
-                elif tvl >= 100_000_000:
-                    conf += 20
-                elif tvl >= 10_000_000:
-                    conf += 10
-
-                cat_lower = category.lower() if category else ""
-                if "dex" in cat_lower or "lending" in cat_lower:
-                    conf += 5
-                if "liquid staking" in cat_lower:
-                    conf += 8
-
-                airdrops.append(AirdropInfo(
-                    name=name,
-                    chain=chain,
-                    category="defi",
-                    description=f"TVL: ${tvl/1e6:.1f}M | カテゴリ: {category} | チェーン: {', '.join(chains[:3])}",
-                    url=f"https://defillama.com/protocol/{p.get('slug', name.lower().replace(' ', '-'))}",
-                    status="speculative",
-                    source="defillama-defi",
-                    confidence=min(conf, 95),
-                    tvl=tvl,
-                ))
-
+            defi, _ = await self._classified_protocols()
+            return list(defi)
         except Exception as e:
             logger.warning(f"DeFiLlama DeFi error: {e}")
+            return []
 
-        return airdrops
-
-    # ============================================================
-    # ソース 2: DeFiLlama (GameFi)
-    # ============================================================
     async def _source_defillama_gamefi(self) -> list[AirdropInfo]:
         """DeFiLlama: ゲーム系プロトコル"""
-        airdrops = []
         try:
-            url = "https://api.llama.fi/protocols"
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                if resp.status != 200:
-                    return airdrops
-                protocols = await resp.json()
-
-            gamefi_categories = {"Gaming", "GameFi", "Metaverse", "Play-to-Earn"}
-
-            for p in protocols:
-                name = p.get("name", "")
-                category = p.get("category", "")
-                tvl = p.get("tvl", 0) or 0
-                gecko_id = p.get("gecko_id")
-                chains = p.get("chains", [])
-
-                if category not in gamefi_categories:
-                    continue
-                if self._is_excluded(name, ""):
-                    continue
-                if gecko_id and gecko_id != "-":
-                    continue
-
-                chain = "multi"
-                if chains:
-                    chain_lower = [c.lower() for c in chains]
-                    if "solana" in chain_lower:
-                        chain = "solana"
-                    elif "ethereum" in chain_lower:
-                        chain = "ethereum"
-
-                conf = 45
-                if tvl >= 10_000_000:
-                    conf += 15
-                elif tvl >= 1_000_000:
-                    conf += 8
-
-                airdrops.append(AirdropInfo(
-                    name=name,
-                    chain=chain,
-                    category="gamefi",
-                    description=f"GameFi | TVL: ${tvl/1e6:.1f}M | チェーン: {', '.join(chains[:3])}",
-                    url=f"https://defillama.com/protocol/{p.get('slug', name.lower().replace(' ', '-'))}",
-                    status="speculative",
-                    source="defillama-gamefi",
-                    confidence=min(conf, 90),
-                    tvl=tvl,
-                ))
-
+            _, gamefi = await self._classified_protocols()
+            return list(gamefi)
         except Exception as e:
             logger.warning(f"DeFiLlama GameFi error: {e}")
-
-        return airdrops
+            return []
 
     # ============================================================
     # ソース 3: DeFiLlama (Raises — 最近の資金調達)
@@ -348,19 +513,18 @@ class AirdropScanner:
         """DeFiLlama Raises: 最近の資金調達 → 新規プロジェクト優先"""
         airdrops = []
         try:
-            url = "https://api.llama.fi/raises"
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                if resp.status != 200:
-                    return airdrops
-                data = await resp.json()
+            data = await self._cached_json(
+                "https://api.llama.fi/raises", ttl=self.DEFILLAMA_CACHE_TTL,
+            )
+            if not data:
+                return airdrops
 
             raises = data.get("raises", data) if isinstance(data, dict) else data
             if not isinstance(raises, list):
                 return airdrops
 
             # 直近90日の資金調達のみ
-            import time as _time
-            cutoff = _time.time() - 90 * 86400
+            cutoff = time.time() - 90 * 86400
 
             for r in raises:
                 date = r.get("date")
@@ -379,29 +543,17 @@ class AirdropScanner:
                 if amount < 1_000_000:  # $1M未満は除外
                     continue
 
-                chain = "multi"
-                if chains:
-                    chain_lower = [c.lower() for c in chains]
-                    if "solana" in chain_lower:
-                        chain = "solana"
-                    elif "ethereum" in chain_lower:
-                        chain = "ethereum"
-                    elif "arbitrum" in chain_lower:
-                        chain = "arbitrum"
-                    elif "base" in chain_lower:
-                        chain = "base"
+                chain = self._detect_chain(
+                    frozenset(c.lower() for c in chains), self.RAISE_CHAIN_PRIORITY,
+                ) if chains else "multi"
 
                 # カテゴリ判定
                 cat = "defi"
                 cat_lower = (category or "").lower()
-                if any(g in cat_lower for g in ["game", "gaming", "metaverse"]):
-                    cat = "gamefi"
-                elif any(n in cat_lower for n in ["nft", "collectible"]):
-                    cat = "nft"
-                elif any(i in cat_lower for i in ["infra", "tool", "analytics"]):
-                    cat = "infra"
-                elif any(l in cat_lower for l in ["l1", "l2", "chain", "rollup"]):
-                    cat = "l2"
+                for label, keywords in self.RAISE_CATEGORY_KEYWORDS:
+                    if any(kw in cat_lower for kw in keywords):
+                        cat = label
+                        break
 
                 # 確度スコア
                 conf = 50
@@ -413,10 +565,9 @@ class AirdropScanner:
                     conf += 10
 
                 # 有名VCが入っていると確度UP
-                top_vcs = ["a16z", "paradigm", "sequoia", "polychain", "multicoin",
-                           "binance labs", "coinbase ventures", "dragonfly"]
                 for inv in investors:
-                    if any(vc in (inv or "").lower() for vc in top_vcs):
+                    inv_lower = (inv or "").lower()
+                    if any(vc in inv_lower for vc in self.TOP_VCS):
                         conf += 5
                         break
 
@@ -445,15 +596,13 @@ class AirdropScanner:
         """CoinGecko: 新規上場トークン"""
         airdrops = []
         try:
-            url = "https://api.coingecko.com/api/v3/coins/list?include_platform=true"
-            async with self.session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=15),
+            coins = await self._cached_json(
+                "https://api.coingecko.com/api/v3/coins/list?include_platform=true",
+                ttl=self.COINGECKO_CACHE_TTL,
                 headers={"Accept": "application/json"},
-            ) as resp:
-                if resp.status != 200:
-                    return airdrops
-                coins = await resp.json()
+            )
+            if not coins:
+                return airdrops
 
             for coin in coins[-50:]:
                 name = coin.get("name", "")
@@ -496,17 +645,11 @@ class AirdropScanner:
             return airdrops
 
         try:
-            url = "https://airdropalert.com/new-airdrops"
-            async with self.session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=12),
-                headers={"User-Agent": "Mozilla/5.0 (compatible; SolScreener/5.3)"},
-            ) as resp:
-                if resp.status != 200:
-                    return airdrops
-                html = await resp.text()
-
-            soup = BeautifulSoup(html, "html.parser")
+            html = await self._get_text("https://airdropalert.com/new-airdrops")
+            if not html:
+                return airdrops
+
+            soup = BeautifulSoup(html, "html.parser", parse_only=_AIRDROPALERT_STRAINER)
             cards = soup.select(".airdrop-card, .card, [class*='airdrop']")
 
             for card in cards[:30]:
@@ -550,53 +693,62 @@ class AirdropScanner:
     # ソース 6: CryptoTotem
     # ============================================================
     async def _source_cryptototem(self) -> list[AirdropInfo]:
-        """CryptoTotem: エアドロ・ICO情報"""
-        airdrops = []
+        """CryptoTotem: エアドロ・ICO情報（2ページを同時取得）"""
         if not BeautifulSoup:
-            return airdrops
+            return []
+
+        sem = asyncio.Semaphore(2)
+        results = await asyncio.gather(
+            *[
+                self._fetch_cryptototem_page(page_url, sem)
+                for page_url in (
+                    "https://cryptototem.com/airdrops/",
+                    "https://cryptototem.com/retrodrop/",
+                )
+            ],
+            return_exceptions=True,
+        )
 
-        for page_url in [
-            "https://cryptototem.com/airdrops/",
-            "https://cryptototem.com/retrodrop/",
-        ]:
-            try:
-                async with self.session.get(
-                    page_url,
-                    timeout=aiohttp.ClientTimeout(total=12),
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; SolScreener/5.3)"},
-                ) as resp:
-                    if resp.status != 200:
-                        continue
-                    html = await resp.text()
-
-                soup = BeautifulSoup(html, "html.parser")
-                items = soup.select(".ico-card, .card, [class*='project'], tr")
-
-                for item in items[:20]:
-                    title_el = item.select_one("h3, h4, .name, a, td:first-child")
-                    if not title_el:
-                        continue
-                    name = title_el.get_text(strip=True)
-                    if not name or len(name) < 2 or self._is_excluded(name, ""):
-                        continue
-
-                    is_retro = "retrodrop" in page_url
-                    airdrops.append(AirdropInfo(
-                        name=name,
-                        chain="multi",
-                        category="defi",
-                        description=f"{'Retrodrop' if is_retro else 'Airdrop'} | CryptoTotem掲載",
-                        url=page_url,
-                        status="active" if not is_retro else "upcoming",
-                        source="cryptototem",
-                        confidence=52,
-                        is_new=True,
-                    ))
+        airdrops = []
+        for r in results:
+            if isinstance(r, Exception):
+                logger.debug(f"CryptoTotem error: {r}")
+            else:
+                airdrops.extend(r)
+        return airdrops
 
-            except Exception as e:
-                logger.debug(f"CryptoTotem error: {e}")
+    async def _fetch_cryptototem_page(self, page_url: str,
+                                      sem: asyncio.Semaphore) -> list[AirdropInfo]:
+        """CryptoTotem の1ページを取得・パース"""
+        airdrops = []
+        async with sem:
+            html = await self._get_text(page_url)
+        if not html:
+            return airdrops
 
-            await asyncio.sleep(1)
+        soup = BeautifulSoup(html, "html.parser")
+        items = soup.select(".ico-card, .card, [class*='project'], tr")
+
+        is_retro = "retrodrop" in page_url
+        for item in items[:20]:
+            title_el = item.select_one("h3, h4, .name, a, td:first-child")
+            if not title_el:
+                continue
+            name = title_el.get_text(strip=True)
+            if not name or len(name) < 2 or self._is_excluded(name, ""):
+                continue
+
+            airdrops.append(AirdropInfo(
+                name=name,
+                chain="multi",
+                category="defi",
+                description=f"{'Retrodrop' if is_retro else 'Airdrop'} | CryptoTotem掲載",
+                url=page_url,
+                status="active" if not is_retro else "upcoming",
+                source="cryptototem",
+                confidence=52,
+                is_new=True,
+            ))
 
         return airdrops
 
@@ -605,523 +757,39 @@ class AirdropScanner:
     # ============================================================
     async def _source_exchange_news(self) -> list[AirdropInfo]:
         """取引所のエアドロ・ローンチプール情報"""
-        airdrops = []
         try:
-            url = "https://www.binance.com/bapi/earn/v1/public/launchpool/project/list"
-            async with self.session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=10),
+            data = await self._cached_json(
+                "https://www.binance.com/bapi/earn/v1/public/launchpool/project/list",
                 headers={"Accept": "application/json"},
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    projects = data.get("data", [])
-                    if isinstance(projects, list):
-                        for proj in projects[:10]:
-                            name = proj.get("projectName", "") or proj.get("asset", "")
-                            if name:
-                                airdrops.append(AirdropInfo(
-                                    name=f"{name} (Binance Launchpool)",
-                                    chain="multi",
-                                    category="defi",
-                                    description="Binance Launchpoolで配布中/予定",
-                                    url="https://www.binance.com/en/launchpool",
-                                    status="active",
-                                    source="binance-launchpool",
-                                    confidence=85,
-                                    is_new=True,
-                                ))
+            )
+            if not data:
+                return []
+
+            return [
+                AirdropInfo(
+                    name=f"{name} (Binance Launchpool)",
+                    chain="multi",
+                    category="defi",
+                    description="Binance Launchpoolで配布中/予定",
+                    url="https://www.binance.com/en/launchpool",
+                    status="active",
+                    source="binance-launchpool",
+                    confidence=85,
+                    is_new=True,
+                )
+                for proj in (data.get("data") or [])[:10]
+                if (name := proj.get("projectName", "") or proj.get("asset", ""))
+            ]
         except Exception as e:
             logger.debug(f"Exchange news error: {e}")
-
-        return airdrops
+            return []
 
     # ============================================================
     # ソース 8: キュレーションリスト（大幅拡充版）
     # ============================================================
     async def _source_curated(self) -> list[AirdropInfo]:
-        """手動選定のエアドロ候補（BCG/GameFi含む大量追加）"""
-        curated = [
-            # ─── Solana DeFi ───
-            AirdropInfo(
-                name="Jupiter Season 3+",
-                chain="solana", category="defi",
-                description="Solana最大DEXアグリゲータ。JUP追加配布。Perp/DCA利用でポイント獲得。",
-                url="https://jup.ag", status="active",
-                requirements=["Swap利用", "Perp取引", "ステーキング"],
-                source="curated", confidence=92,
-            ),
-            AirdropInfo(
-                name="Meteora Season 2",
-                chain="solana", category="defi",
-                description="Solana LP最適化。DLMM LP提供でMETポイント獲得。",
-                url="https://meteora.ag", status="active",
-                requirements=["DLMM LP提供", "ダイナミックプール"],
-                source="curated", confidence=92,
-            ),
-            AirdropInfo(
-                name="Kamino Season 2+",
-                chain="solana", category="defi",
-                description="レンディング・ステーキング・LP。Season 1で1ウォレット平均$300配布。",
-                url="https://kamino.finance", status="upcoming",
-                requirements=["レンディング", "ステーキング", "LP提供"],
-                source="curated", confidence=88,
-            ),
-            AirdropInfo(
-                name="Sanctum (CLOUD)",
-                chain="solana", category="defi",
-                description="リキッドステーキングインフラ。ポイントプログラム進行中。",
-                url="https://sanctum.so", status="active",
-                requirements=["SOLステーキング", "LST保有"],
-                source="curated", confidence=85,
-            ),
-            AirdropInfo(
-                name="Axiom Trade",
-                chain="solana", category="defi",
-                description="Perp取引プロトコル。ポイントベースの報酬システム。",
-                url="https://axiom.trade", status="active",
-                requirements=["Perp取引", "ポイント獲得"],
-                source="curated", confidence=78,
-            ),
-            AirdropInfo(
-                name="Drift Protocol Season 2",
-                chain="solana", category="defi",
-                description="Solana最大Perp DEX。追加DRIFT配布期待。",
-                url="https://drift.trade", status="upcoming",
-                requirements=["Perp取引", "LP提供", "ステーキング"],
-                source="curated", confidence=75,
-            ),
-            AirdropInfo(
-                name="Marginfi Season 2",
-                chain="solana", category="defi",
-                description="Solanaレンディング。ポイントプログラム継続中。",
-                url="https://marginfi.com", status="active",
-                requirements=["レンディング", "借入", "ポイント獲得"],
-                source="curated", confidence=78,
-            ),
-            AirdropInfo(
-                name="Tensor Season 3",
-                chain="solana", category="nft",
-                description="Solana NFTマーケットプレイス。TNSR追加配布期待。",
-                url="https://tensor.trade", status="upcoming",
-                requirements=["NFT取引", "入札", "コレクション"],
-                source="curated", confidence=72,
-            ),
-            AirdropInfo(
-                name="Parcl",
-                chain="solana", category="defi",
-                description="不動産インデックス取引。ポイントプログラム進行中。",
-                url="https://parcl.co", status="active",
-                requirements=["取引", "LP提供"],
-                source="curated", confidence=68,
-            ),
-
-            # ─── Ethereum / L2 DeFi ───
-            AirdropInfo(
-                name="EigenLayer Season 2+",
-                chain="ethereum", category="defi",
-                description="リステーキングプロトコル。TVL $15B+。EIGEN追加配布が期待される。",
-                url="https://eigenlayer.xyz", status="upcoming",
-                requirements=["ETHリステーキング", "AVS選択", "ガバナンス"],
-                source="curated", confidence=88,
-            ),
-            AirdropInfo(
-                name="EtherFi Season 3",
-                chain="ethereum", category="defi",
-                description="リキッドリステーキング。eETH保有・DeFi利用でポイント獲得。",
-                url="https://ether.fi", status="active",
-                requirements=["eETH保有", "DeFi利用", "ポイント獲得"],
-                source="curated", confidence=88,
-            ),
-            AirdropInfo(
-                name="Pendle Season 2+",
-                chain="ethereum", category="defi",
-                description="利回りトークン化。YT/PT取引・LP提供でvePENDLE報酬。",
-                url="https://pendle.finance", status="upcoming",
-                requirements=["YT/PT取引", "LP提供", "vePENDLE保有"],
-                source="curated", confidence=78,
-            ),
-            AirdropInfo(
-                name="Morpho",
-                chain="ethereum", category="defi",
-                description="レンディング最適化。$MORPHO配布進行中。利用量に応じた配布。",
-                url="https://morpho.org", status="active",
-                requirements=["レンディング利用", "Vault提供"],
-                source="curated", confidence=85,
-            ),
-            AirdropInfo(
-                name="Ethena (ENA) Season 3",
-                chain="ethereum", category="defi",
-                description="合成ドルUSDe。sUSDe保有・LP提供でSats獲得。",
-                url="https://ethena.fi", status="active",
-                requirements=["sUSDe保有", "LP提供", "Sats獲得"],
-                source="curated", confidence=85,
-            ),
-            AirdropInfo(
-                name="Symbiotic",
-                chain="ethereum", category="defi",
-                description="リステーキングプロトコル。EigenLayerの競合。トークン未発行。",
-                url="https://symbiotic.fi", status="speculative",
-                requirements=["リステーキング", "Vault利用"],
-                source="curated", confidence=80,
-            ),
-            AirdropInfo(
-                name="Hyperliquid Season 2",
-                chain="arbitrum", category="defi",
-                description="Perp DEX。HYPE追加配布期待。取引量に応じたポイント。",
-                url="https://hyperliquid.xyz", status="upcoming",
-                requirements=["Perp取引", "流動性提供"],
-                source="curated", confidence=82,
-            ),
-            AirdropInfo(
-                name="Aave V4",
-                chain="ethereum", category="defi",
-                description="最大レンディングプロトコル。V4アップグレードに伴う追加インセンティブ期待。",
-                url="https://aave.com", status="speculative",
-                requirements=["レンディング", "ガバナンス参加"],
-                source="curated", confidence=60,
-            ),
-            AirdropInfo(
-                name="Usual Protocol",
-                chain="ethereum", category="defi",
-                description="RWAステーブルコイン。USD0保有でUSUALトークン獲得。",
-                url="https://usual.money", status="active",
-                requirements=["USD0保有", "ステーキング"],
-                source="curated", confidence=78,
-            ),
-
-            # ─── L2 / 新興チェーン ───
-            AirdropInfo(
-                name="Berachain (BERA)",
-                chain="berachain", category="l2",
-                description="Proof of Liquidity。メインネットローンチ済み。BGT獲得でガバナンス参加。",
-                url="https://berachain.com", status="active",
-                requirements=["流動性提供", "BGT獲得", "ガバナンス"],
-                source="curated", confidence=92,
-            ),
-            AirdropInfo(
-                name="Monad",
-                chain="monad", category="l2",
-                description="超高速EVM L1。テストネット進行中。$225M調達。エアドロ期待大。",
-                url="https://monad.xyz", status="speculative",
-                requirements=["テストネット参加", "コミュニティ活動"],
-                source="curated", confidence=88,
-            ),
-            AirdropInfo(
-                name="MegaETH",
-                chain="megaeth", category="l2",
-                description="リアルタイムEVM L2。$20M調達。",
-                url="https://megaeth.systems", status="active",
-                requirements=["テストネット参加", "ブリッジ利用"],
-                source="curated", confidence=82,
-            ),
-            AirdropInfo(
-                name="Abstract",
-                chain="ethereum", category="l2",
-                description="消費者向けL2。テストネット進行中。Pudgy Penguinsチーム。",
-                url="https://abs.xyz", status="active",
-                requirements=["テストネット参加", "NFT保有"],
-                source="curated", confidence=82,
-            ),
-            AirdropInfo(
-                name="Scroll Season 2",
-                chain="scroll", category="l2",
-                description="zkRollup L2。Session 2進行中。ブリッジ・DeFi利用でマーク獲得。",
-                url="https://scroll.io", status="active",
-                requirements=["ブリッジ利用", "DeFi利用", "マーク獲得"],
-                source="curated", confidence=78,
-            ),
-            AirdropInfo(
-                name="Linea Season 2",
-                chain="linea", category="l2",
-                description="Consensys L2。LXP-L獲得プログラム進行中。",
-                url="https://linea.build", status="active",
-                requirements=["ブリッジ利用", "DeFi利用", "LXP獲得"],
-                source="curated", confidence=75,
-            ),
-            AirdropInfo(
-                name="Fuel Network",
-                chain="ethereum", category="l2",
-                description="モジュラーL2。テストネット進行中。$80M調達。",
-                url="https://fuel.network", status="speculative",
-                requirements=["テストネット参加", "ブリッジ利用"],
-                source="curated", confidence=72,
-            ),
-            AirdropInfo(
-                name="Eclipse",
-                chain="solana", category="l2",
-                description="Solana VM搭載のEthereum L2。メインネットローンチ間近。",
-                url="https://eclipse.xyz", status="speculative",
-                requirements=["テストネット参加", "ブリッジ利用"],
-                source="curated", confidence=75,
-            ),
-            AirdropInfo(
-                name="Movement Labs",
-                chain="ethereum", category="l2",
-                description="Move言語ベースのL2。$38M調達。テストネット進行中。",
-                url="https://movementlabs.xyz", status="speculative",
-                requirements=["テストネット参加", "ブリッジ利用"],
-                source="curated", confidence=78,
-            ),
-
-            # ─── NFT / マーケットプレイス ───
-            AirdropInfo(
-                name="Magic Eden Season 3",
-                chain="multi", category="nft",
-                description="マルチチェーンNFTマーケットプレイス。ガバナンス参加・クエスト完了で対象。",
-                url="https://magiceden.io", status="active",
-                requirements=["MEウォレット", "ガバナンス参加", "クエスト完了"],
-                source="curated", confidence=92,
-            ),
-            AirdropInfo(
-                name="OpenSea",
-                chain="ethereum", category="nft",
-                description="最大NFTマーケットプレイス。SEAトークン発行の噂。過去利用者にRetrodrop期待。",
-                url="https://opensea.io", status="speculative",
-                requirements=["NFT取引履歴", "アクティブ利用"],
-                source="curated", confidence=72,
-            ),
-            AirdropInfo(
-                name="Blur Season 4",
-                chain="ethereum", category="nft",
-                description="NFTマーケットプレイス。BLUR追加配布。入札・リスティングでポイント。",
-                url="https://blur.io", status="active",
-                requirements=["NFT入札", "リスティング", "レンディング"],
-                source="curated", confidence=75,
-            ),
-
-            # ─── GameFi / BCG（大幅拡充） ───
-            AirdropInfo(
-                name="Star Atlas (ATLAS/POLIS)",
-                chain="solana", category="gamefi",
-                description="大型宇宙MMO。ゲーム内活動・NFT保有でシーズン報酬。",
-                url="https://staratlas.com", status="upcoming",
-                requirements=["ゲームプレイ", "NFT保有", "DAO参加"],
-                source="curated", confidence=68,
-            ),
-            AirdropInfo(
-                name="Pixels",
-                chain="ethereum", category="gamefi",
-                description="Web3農業ゲーム。Ronin Chain。$PIXEL追加配布期待。",
-                url="https://pixels.xyz", status="upcoming",
-                requirements=["ゲームプレイ", "土地NFT保有"],
-                source="curated", confidence=62,
-            ),
-            AirdropInfo(
-                name="Nyan Heroes",
-                chain="solana", category="gamefi",
-                description="猫×メカのバトルロイヤルFPS。トークンローンチ予定。",
-                url="https://nyanheroes.com", status="speculative",
-                requirements=["ゲームプレイ", "NFT保有"],
-                source="curated", confidence=62,
-            ),
-            AirdropInfo(
-                name="Parallel (PRIME)",
-                chain="ethereum", category="gamefi",
-                description="SF TCG。Echelon Prime。追加シーズン報酬期待。",
-                url="https://parallel.life", status="upcoming",
-                requirements=["ゲームプレイ", "カードNFT保有"],
-                source="curated", confidence=58,
-            ),
-            AirdropInfo(
-                name="Illuvium",
-                chain="ethereum", category="gamefi",
-                description="AAA品質のオープンワールドRPG。ILVステーキング・ゲームプレイ報酬。",
-                url="https://illuvium.io", status="active",
-                requirements=["ゲームプレイ", "ILVステーキング", "ランド保有"],
-                source="curated", confidence=65,
-            ),
-            AirdropInfo(
-                name="Shrapnel",
-                chain="avalanche", category="gamefi",
-                description="AAA FPSゲーム。UGCマーケットプレイス。トークン未発行。",
-                url="https://shrapnel.com", status="speculative",
-                requirements=["ゲームプレイ", "NFT保有", "UGC作成"],
-                source="curated", confidence=62,
-            ),
-            AirdropInfo(
-                name="Pirate Nation",
-                chain="ethereum", category="gamefi",
-                description="フルオンチェーンRPG。Proof of Playチーム。PIRATE追加配布期待。",
-                url="https://piratenation.game", status="active",
-                requirements=["ゲームプレイ", "クエスト完了"],
-                source="curated", confidence=65,
-            ),
-            AirdropInfo(
-                name="Aurory",
-                chain="solana", category="gamefi",
-                description="Solana RPG。AURY追加配布・シーズン報酬。",
-                url="https://aurory.io", status="upcoming",
-                requirements=["ゲームプレイ", "NFT保有"],
-                source="curated", confidence=58,
-            ),
-            AirdropInfo(
-                name="Wildcard",
-                chain="ethereum", category="gamefi",
-                description="Web3 TCG。$16M調達。トークン未発行。",
-                url="https://playwildcard.com", status="speculative",
-                requirements=["ゲームプレイ", "NFT保有"],
-                source="curated", confidence=65,
-            ),
-            AirdropInfo(
-                name="MapleStory Universe",
-                chain="avalanche", category="gamefi",
-                description="MapleStoryのWeb3版。Nexon開発。テストネット進行中。",
-                url="https://maplestoryuniverse.com", status="speculative",
-                requirements=["テストネット参加", "ゲームプレイ"],
-                source="curated", confidence=72,
-            ),
-            AirdropInfo(
-                name="Off The Grid",
-                chain="avalanche", category="gamefi",
-                description="バトルロイヤルFPS。Gunzillaチーム。GUN追加配布期待。",
-                url="https://offthegrid.fun", status="active",
-                requirements=["ゲームプレイ", "ランク上げ"],
-                source="curated", confidence=68,
-            ),
-            AirdropInfo(
-                name="Xai Games",
-                chain="arbitrum", category="gamefi",
-                description="Arbitrum上のゲーム専用L3。XAI追加配布・ノード報酬。",
-                url="https://xai.games", status="active",
-                requirements=["ゲームプレイ", "ノード運用", "ステーキング"],
-                source="curated", confidence=72,
-            ),
-            AirdropInfo(
-                name="Ronin Network Season 2",
-                chain="ronin", category="gamefi",
-                description="Axie Infinityチェーン。RON追加配布。ゲーム・DeFi利用で対象。",
-                url="https://roninchain.com", status="upcoming",
-                requirements=["ブリッジ利用", "DeFi利用", "ゲームプレイ"],
-                source="curated", confidence=72,
-            ),
-            AirdropInfo(
-                name="Immutable zkEVM",
-                chain="ethereum", category="gamefi",
-                description="ゲーム特化L2。IMX追加配布。ゲーム利用・NFT取引で対象。",
-                url="https://immutable.com", status="active",
-                requirements=["ゲームプレイ", "NFT取引", "ブリッジ利用"],
-                source="curated", confidence=75,
-            ),
-            AirdropInfo(
-                name="Beam (Merit Circle)",
-                chain="beam", category="gamefi",
-                description="ゲーム特化チェーン。BEAM追加配布。ゲームハブ利用で対象。",
-                url="https://beam.eco", status="active",
-                requirements=["ゲームプレイ", "ステーキング"],
-                source="curated", confidence=68,
-            ),
-            AirdropInfo(
-                name="Treasure DAO",
-                chain="arbitrum", category="gamefi",
-                description="ゲームエコシステム。MAGIC追加配布。Bridgeworld・Smolverse。",
-                url="https://treasure.lol", status="upcoming",
-                requirements=["ゲームプレイ", "MAGICステーキング"],
-                source="curated", confidence=62,
-            ),
-            AirdropInfo(
-                name="Gala Games Season 2",
-                chain="ethereum", category="gamefi",
-                description="大手Web3ゲームプラットフォーム。GALA追加配布・ノード報酬。",
-                url="https://gala.games", status="upcoming",
-                requirements=["ゲームプレイ", "ノード運用"],
-                source="curated", confidence=60,
-            ),
-            AirdropInfo(
-                name="Apeiron",
-                chain="ronin", category="gamefi",
-                description="ゴッドゲーム×ローグライク。NFT惑星保有で報酬。",
-                url="https://apeironnft.com", status="active",
-                requirements=["ゲームプレイ", "惑星NFT保有"],
-                source="curated", confidence=58,
-            ),
-
-            # ─── インフラ ───
-            AirdropInfo(
-                name="Grass Season 2",
-                chain="solana", category="infra",
-                description="分散型AIデータネットワーク。帯域共有でポイント獲得。",
-                url="https://getgrass.io", status="active",
-                requirements=["ブラウザ拡張インストール", "帯域共有"],
-                source="curated", confidence=78,
-            ),
-            AirdropInfo(
-                name="LayerZero Season 2",
-                chain="multi", category="infra",
-                description="オムニチェーンプロトコル。ZRO追加配布期待。クロスチェーン利用で対象。",
-                url="https://layerzero.network", status="upcoming",
-                requirements=["クロスチェーン送金", "dApp利用"],
-                source="curated", confidence=72,
-            ),
-            AirdropInfo(
-                name="Wormhole Season 2",
-                chain="multi", category="infra",
-                description="クロスチェーンブリッジ。W追加配布期待。ブリッジ利用で対象。",
-                url="https://wormhole.com", status="upcoming",
-                requirements=["ブリッジ利用", "マルチチェーン送金"],
-                source="curated", confidence=68,
-            ),
-            AirdropInfo(
-                name="Initia",
-                chain="cosmos", category="infra",
-                description="モジュラーL1。テストネット進行中。$7.5M調達。",
-                url="https://initia.xyz", status="speculative",
-                requirements=["テストネット参加", "バリデータ運用"],
-                source="curated", confidence=75,
-            ),
-            AirdropInfo(
-                name="Avail",
-                chain="multi", category="infra",
-                description="データ可用性レイヤー。AVAIL追加配布期待。",
-                url="https://availproject.org", status="upcoming",
-                requirements=["テストネット参加", "ライトノード運用"],
-                source="curated", confidence=72,
-            ),
-            AirdropInfo(
-                name="Celestia Season 2",
-                chain="celestia", category="infra",
-                description="モジュラーDA。TIA追加配布期待。ステーキングで対象。",
-                url="https://celestia.org", status="upcoming",
-                requirements=["TIAステーキング", "ガバナンス参加"],
-                source="curated", confidence=72,
-            ),
-
-            # ─── ソーシャル / AI ───
-            AirdropInfo(
-                name="Farcaster",
-                chain="base", category="social",
-                description="分散型SNS。トークン未発行。アクティブ利用で対象。",
-                url="https://farcaster.xyz", status="speculative",
-                requirements=["アカウント作成", "投稿・いいね", "チャンネル参加"],
-                source="curated", confidence=78,
-            ),
-            AirdropInfo(
-                name="Lens Protocol V2",
-                chain="polygon", category="social",
-                description="分散型ソーシャルグラフ。Aave チーム。トークン未発行。",
-                url="https://lens.xyz", status="speculative",
-                requirements=["プロフィール作成", "投稿・コメント"],
-                source="curated", confidence=72,
-            ),
-            AirdropInfo(
-                name="io.net",
-                chain="solana", category="infra",
-                description="分散型GPU。IO追加配布期待。GPU提供・利用で対象。",
-                url="https://io.net", status="upcoming",
-                requirements=["GPU提供", "コンピュート利用"],
-                source="curated", confidence=68,
-            ),
-            AirdropInfo(
-                name="Render Network Season 2",
-                chain="solana", category="infra",
-                description="分散型GPUレンダリング。RNDR追加配布期待。",
-                url="https://rendernetwork.com", status="upcoming",
-                requirements=["GPU提供", "レンダリング利用"],
-                source="curated", confidence=62,
-            ),
-        ]
-
-        return curated
+        """手動選定のエアドロ候補（BCG/GameFi含む大量追加）。中身は末尾の _CURATED"""
+        return list(_CURATED)
 
     # ============================================================
     # ユーティリティ
@@ -1135,6 +803,17 @@ class AirdropScanner:
     def filter_by_confidence(self, airdrops: list[AirdropInfo], min_confidence: int = 50) -> list[AirdropInfo]:
         return [a for a in airdrops if a.confidence >= min_confidence]
 
+    def top_filtered(self, airdrops: list[AirdropInfo], *, chain: Optional[str] = None,
+                     category: Optional[str] = None, min_confidence: int = 50,
+                     n: int = 10) -> list[AirdropInfo]:
+        """チェーン/カテゴリ/確度フィルタ + 確度TOP N を1パスで（中間リストを作らない）"""
+        return heapq.nlargest(n, (
+            a for a in airdrops
+            if a.confidence >= min_confidence
+            and (chain is None or a.chain == chain or a.chain == "multi")
+            and (category is None or a.category == category)
+        ), key=attrgetter("confidence"))
+
     def get_top_diverse(self, airdrops: list[AirdropInfo], n: int = 20,
                         gamefi_min: int = 5) -> list[AirdropInfo]:
         """
@@ -1198,42 +877,28 @@ class AirdropScanner:
         if not airdrops:
             return "エアドロップ情報なし"
 
-        by_chain = {}
+        by_chain: defaultdict[str, list[AirdropInfo]] = defaultdict(list)
         for a in airdrops:
-            by_chain.setdefault(a.chain, []).append(a)
-
-        chain_emoji = {
-            "solana": "◎", "ethereum": "⟠", "arbitrum": "🔵",
-            "base": "🔷", "optimism": "🔴", "polygon": "💜",
-            "bsc": "🟡", "sui": "💧", "berachain": "🐻",
-            "monad": "🟣", "scroll": "📜", "linea": "🌐",
-            "blast": "💥", "multi": "🌍", "avalanche": "🔺",
-            "ronin": "⚔️", "cosmos": "⚛️", "celestia": "🟣",
-        }
-
-        cat_emoji = {
-            "defi": "💰", "gamefi": "🎮", "nft": "🖼️",
-            "infra": "🔧", "social": "💬", "l2": "⛓️", "other": "📦",
-        }
+            by_chain[a.chain].append(a)
 
         lines = [f"**✈️ エアドロップ情報 ({len(airdrops)}件)**\n"]
+        bars = self.CONFIDENCE_BARS
 
         for chain, items in sorted(by_chain.items()):
-            emoji = chain_emoji.get(chain, "🔗")
+            emoji = self.CHAIN_EMOJI.get(chain, "🔗")
             lines.append(f"\n{emoji} **{chain.upper()}** ({len(items)}件)")
 
-            by_cat = {}
+            by_cat: defaultdict[str, list[AirdropInfo]] = defaultdict(list)
             for a in items:
-                by_cat.setdefault(a.category or "other", []).append(a)
+                by_cat[a.category or "other"].append(a)
 
             for cat, cat_items in sorted(by_cat.items()):
-                ce = cat_emoji.get(cat, "📦")
+                ce = self.CATEGORY_EMOJI.get(cat, "📦")
                 for a in cat_items[:3]:
-                    conf_bar = "🟢" if a.confidence >= 70 else "🟡" if a.confidence >= 50 else "🔴"
-                    new_badge = " 🆕" if a.is_new else ""
+                    conf = a.confidence
                     lines.append(
-                        f"  {conf_bar} {ce} **{a.name}**{new_badge} [{a.status}] "
-                        f"(確度: {a.confidence}%)"
+                        f"  {bars[(conf >= 50) + (conf >= 70)]} {ce} **{a.name}**"
+                        f"{' 🆕' if a.is_new else ''} [{a.status}] (確度: {conf}%)"
                     )
                     if a.description:
                         lines.append(f"    {a.description[:80]}...")
@@ -1241,3 +906,487 @@ class AirdropScanner:
                         lines.append(f"    📋 {', '.join(a.requirements[:3])}")
 
         return "\n".join(lines)
+
+
+# ============================================================
+# キュレーションリスト（import 時に一度だけ構築、AirdropInfo は不変）
+# ============================================================
+_CURATED: tuple[AirdropInfo, ...] = (
+    # ─── Solana DeFi ───
+    AirdropInfo(
+        name="Jupiter Season 3+",
+        chain="solana", category="defi",
+        description="Solana最大DEXアグリゲータ。JUP追加配布。Perp/DCA利用でポイント獲得。",
+        url="https://jup.ag", status="active",
+        requirements=["Swap利用", "Perp取引", "ステーキング"],
+        source="curated", confidence=92,
+    ),
+    AirdropInfo(
+        name="Meteora Season 2",
+        chain="solana", category="defi",
+        description="Solana LP最適化。DLMM LP提供でMETポイント獲得。",
+        url="https://meteora.ag", status="active",
+        requirements=["DLMM LP提供", "ダイナミックプール"],
+        source="curated", confidence=92,
+    ),
+    AirdropInfo(
+        name="Kamino Season 2+",
+        chain="solana", category="defi",
+        description="レンディング・ステーキング・LP。Season 1で1ウォレット平均$300配布。",
+        url="https://kamino.finance", status="upcoming",
+        requirements=["レンディング", "ステーキング", "LP提供"],
+        source="curated", confidence=88,
+    ),
+    AirdropInfo(
+        name="Sanctum (CLOUD)",
+        chain="solana", category="defi",
+        description="リキッドステーキングインフラ。ポイントプログラム進行中。",
+        url="https://sanctum.so", status="active",
+        requirements=["SOLステーキング", "LST保有"],
+        source="curated", confidence=85,
+    ),
+    AirdropInfo(
+        name="Axiom Trade",
+        chain="solana", category="defi",
+        description="Perp取引プロトコル。ポイントベースの報酬システム。",
+        url="https://axiom.trade", status="active",
+        requirements=["Perp取引", "ポイント獲得"],
+        source="curated", confidence=78,
+    ),
+    AirdropInfo(
+        name="Drift Protocol Season 2",
+        chain="solana", category="defi",
+        description="Solana最大Perp DEX。追加DRIFT配布期待。",
+        url="https://drift.trade", status="upcoming",
+        requirements=["Perp取引", "LP提供", "ステーキング"],
+        source="curated", confidence=75,
+    ),
+    AirdropInfo(
+        name="Marginfi Season 2",
+        chain="solana", category="defi",
+        description="Solanaレンディング。ポイントプログラム継続中。",
+        url="https://marginfi.com", status="active",
+        requirements=["レンディング", "借入", "ポイント獲得"],
+        source="curated", confidence=78,
+    ),
+    AirdropInfo(
+        name="Tensor Season 3",
+        chain="solana", category="nft",
+        description="Solana NFTマーケットプレイス。TNSR追加配布期待。",
+        url="https://tensor.trade", status="upcoming",
+        requirements=["NFT取引", "入札", "コレクション"],
+        source="curated", confidence=72,
+    ),
+    AirdropInfo(
+        name="Parcl",
+        chain="solana", category="defi",
+        description="不動産インデックス取引。ポイントプログラム進行中。",
+        url="https://parcl.co", status="active",
+        requirements=["取引", "LP提供"],
+        source="curated", confidence=68,
+    ),
+
+    # ─── Ethereum / L2 DeFi ───
+    AirdropInfo(
+        name="EigenLayer Season 2+",
+        chain="ethereum", category="defi",
+        description="リステーキングプロトコル。TVL $15B+。EIGEN追加配布が期待される。",
+        url="https://eigenlayer.xyz", status="upcoming",
+        requirements=["ETHリステーキング", "AVS選択", "ガバナンス"],
+        source="curated", confidence=88,
+    ),
+    AirdropInfo(
+        name="EtherFi Season 3",
+        chain="ethereum", category="defi",
+        description="リキッドリステーキング。eETH保有・DeFi利用でポイント獲得。",
+        url="https://ether.fi", status="active",
+        requirements=["eETH保有", "DeFi利用", "ポイント獲得"],
+        source="curated", confidence=88,
+    ),
+    AirdropInfo(
+        name="Pendle Season 2+",
+        chain="ethereum", category="defi",
+        description="利回りトークン化。YT/PT取引・LP提供でvePENDLE報酬。",
+        url="https://pendle.finance", status="upcoming",
+        requirements=["YT/PT取引", "LP提供", "vePENDLE保有"],
+        source="curated", confidence=78,
+    ),
+    AirdropInfo(
+        name="Morpho",
+        chain="ethereum", category="defi",
+        description="レンディング最適化。$MORPHO配布進行中。利用量に応じた配布。",
+        url="https://morpho.org", status="active",
+        requirements=["レンディング利用", "Vault提供"],
+        source="curated", confidence=85,
+    ),
+    AirdropInfo(
+        name="Ethena (ENA) Season 3",
+        chain="ethereum", category="defi",
+        description="合成ドルUSDe。sUSDe保有・LP提供でSats獲得。",
+        url="https://ethena.fi", status="active",
+        requirements=["sUSDe保有", "LP提供", "Sats獲得"],
+        source="curated", confidence=85,
+    ),
+    AirdropInfo(
+        name="Symbiotic",
+        chain="ethereum", category="defi",
+        description="リステーキングプロトコル。EigenLayerの競合。トークン未発行。",
+        url="https://symbiotic.fi", status="speculative",
+        requirements=["リステーキング", "Vault利用"],
+        source="curated", confidence=80,
+    ),
+    AirdropInfo(
+        name="Hyperliquid Season 2",
+        chain="arbitrum", category="defi",
+        description="Perp DEX。HYPE追加配布期待。取引量に応じたポイント。",
+        url="https://hyperliquid.xyz", status="upcoming",
+        requirements=["Perp取引", "流動性提供"],
+        source="curated", confidence=82,
+    ),
+    AirdropInfo(
+        name="Aave V4",
+        chain="ethereum", category="defi",
+        description="最大レンディングプロトコル。V4アップグレードに伴う追加インセンティブ期待。",
+        url="https://aave.com", status="speculative",
+        requirements=["レンディング", "ガバナンス参加"],
+        source="curated", confidence=60,
+    ),
+    AirdropInfo(
+        name="Usual Protocol",
+        chain="ethereum", category="defi",
+        description="RWAステーブルコイン。USD0保有でUSUALトークン獲得。",
+        url="https://usual.money", status="active",
+        requirements=["USD0保有", "ステーキング"],
+        source="curated", confidence=78,
+    ),
+
+    # ─── L2 / 新興チェーン ───
+    AirdropInfo(
+        name="Berachain (BERA)",
+        chain="berachain", category="l2",
+        description="Proof of Liquidity。メインネットローンチ済み。BGT獲得でガバナンス参加。",
+        url="https://berachain.com", status="active",
+        requirements=["流動性提供", "BGT獲得", "ガバナンス"],
+        source="curated", confidence=92,
+    ),
+    AirdropInfo(
+        name="Monad",
+        chain="monad", category="l2",
+        description="超高速EVM L1。テストネット進行中。$225M調達。エアドロ期待大。",
+        url="https://monad.xyz", status="speculative",
+        requirements=["テストネット参加", "コミュニティ活動"],
+        source="curated", confidence=88,
+    ),
+    AirdropInfo(
+        name="MegaETH",
+        chain="megaeth", category="l2",
+        description="リアルタイムEVM L2。$20M調達。",
+        url="https://megaeth.systems", status="active",
+        requirements=["テストネット参加", "ブリッジ利用"],
+        source="curated", confidence=82,
+    ),
+    AirdropInfo(
+        name="Abstract",
+        chain="ethereum", category="l2",
+        description="消費者向けL2。テストネット進行中。Pudgy Penguinsチーム。",
+        url="https://abs.xyz", status="active",
+        requirements=["テストネット参加", "NFT保有"],
+        source="curated", confidence=82,
+    ),
+    AirdropInfo(
+        name="Scroll Season 2",
+        chain="scroll", category="l2",
+        description="zkRollup L2。Session 2進行中。ブリッジ・DeFi利用でマーク獲得。",
+        url="https://scroll.io", status="active",
+        requirements=["ブリッジ利用", "DeFi利用", "マーク獲得"],
+        source="curated", confidence=78,
+    ),
+    AirdropInfo(
+        name="Linea Season 2",
+        chain="linea", category="l2",
+        description="Consensys L2。LXP-L獲得プログラム進行中。",
+        url="https://linea.build", status="active",
+        requirements=["ブリッジ利用", "DeFi利用", "LXP獲得"],
+        source="curated", confidence=75,
+    ),
+    AirdropInfo(
+        name="Fuel Network",
+        chain="ethereum", category="l2",
+        description="モジュラーL2。テストネット進行中。$80M調達。",
+        url="https://fuel.network", status="speculative",
+        requirements=["テストネット参加", "ブリッジ利用"],
+        source="curated", confidence=72,
+    ),
+    AirdropInfo(
+        name="Eclipse",
+        chain="solana", category="l2",
+        description="Solana VM搭載のEthereum L2。メインネットローンチ間近。",
+        url="https://eclipse.xyz", status="speculative",
+        requirements=["テストネット参加", "ブリッジ利用"],
+        source="curated", confidence=75,
+    ),
+    AirdropInfo(
+        name="Movement Labs",
+        chain="ethereum", category="l2",
+        description="Move言語ベースのL2。$38M調達。テストネット進行中。",
+        url="https://movementlabs.xyz", status="speculative",
+        requirements=["テストネット参加", "ブリッジ利用"],
+        source="curated", confidence=78,
+    ),
+
+    # ─── NFT / マーケットプレイス ───
+    AirdropInfo(
+        name="Magic Eden Season 3",
+        chain="multi", category="nft",
+        description="マルチチェーンNFTマーケットプレイス。ガバナンス参加・クエスト完了で対象。",
+        url="https://magiceden.io", status="active",
+        requirements=["MEウォレット", "ガバナンス参加", "クエスト完了"],
+        source="curated", confidence=92,
+    ),
+    AirdropInfo(
+        name="OpenSea",
+        chain="ethereum", category="nft",
+        description="最大NFTマーケットプレイス。SEAトークン発行の噂。過去利用者にRetrodrop期待。",
+        url="https://opensea.io", status="speculative",
+        requirements=["NFT取引履歴", "アクティブ利用"],
+        source="curated", confidence=72,
+    ),
+    AirdropInfo(
+        name="Blur Season 4",
+        chain="ethereum", category="nft",
+        description="NFTマーケットプレイス。BLUR追加配布。入札・リスティングでポイント。",
+        url="https://blur.io", status="active",
+        requirements=["NFT入札", "リスティング", "レンディング"],
+        source="curated", confidence=75,
+    ),
+
+    # ─── GameFi / BCG（大幅拡充） ───
+    AirdropInfo(
+        name="Star Atlas (ATLAS/POLIS)",
+        chain="solana", category="gamefi",
+        description="大型宇宙MMO。ゲーム内活動・NFT保有でシーズン報酬。",
+        url="https://staratlas.com", status="upcoming",
+        requirements=["ゲームプレイ", "NFT保有", "DAO参加"],
+        source="curated", confidence=68,
+    ),
+    AirdropInfo(
+        name="Pixels",
+        chain="ethereum", category="gamefi",
+        description="Web3農業ゲーム。Ronin Chain。$PIXEL追加配布期待。",
+        url="https://pixels.xyz", status="upcoming",
+        requirements=["ゲームプレイ", "土地NFT保有"],
+        source="curated", confidence=62,
+    ),
+    AirdropInfo(
+        name="Nyan Heroes",
+        chain="solana", category="gamefi",
+        description="猫×メカのバトルロイヤルFPS。トークンローンチ予定。",
+        url="https://nyanheroes.com", status="speculative",
+        requirements=["ゲームプレイ", "NFT保有"],
+        source="curated", confidence=62,
+    ),
+    AirdropInfo(
+        name="Parallel (PRIME)",
+        chain="ethereum", category="gamefi",
+        description="SF TCG。Echelon Prime。追加シーズン報酬期待。",
+        url="https://parallel.life", status="upcoming",
+        requirements=["ゲームプレイ", "カードNFT保有"],
+        source="curated", confidence=58,
+    ),
+    AirdropInfo(
+        name="Illuvium",
+        chain="ethereum", category="gamefi",
+        description="AAA品質のオープンワールドRPG。ILVステーキング・ゲームプレイ報酬。",
+        url="https://illuvium.io", status="active",
+        requirements=["ゲームプレイ", "ILVステーキング", "ランド保有"],
+        source="curated", confidence=65,
+    ),
+    AirdropInfo(
+        name="Shrapnel",
+        chain="avalanche", category="gamefi",
+        description="AAA FPSゲーム。UGCマーケットプレイス。トークン未発行。",
+        url="https://shrapnel.com", status="speculative",
+        requirements=["ゲームプレイ", "NFT保有", "UGC作成"],
+        source="curated", confidence=62,
+    ),
+    AirdropInfo(
+        name="Pirate Nation",
+        chain="ethereum", category="gamefi",
+        description="フルオンチェーンRPG。Proof of Playチーム。PIRATE追加配布期待。",
+        url="https://piratenation.game", status="active",
+        requirements=["ゲームプレイ", "クエスト完了"],
+        source="curated", confidence=65,
+    ),
+    AirdropInfo(
+        name="Aurory",
+        chain="solana", category="gamefi",
+        description="Solana RPG。AURY追加配布・シーズン報酬。",
+        url="https://aurory.io", status="upcoming",
+        requirements=["ゲームプレイ", "NFT保有"],
+        source="curated", confidence=58,
+    ),
+    AirdropInfo(
+        name="Wildcard",
+        chain="ethereum", category="gamefi",
+        description="Web3 TCG。$16M調達。トークン未発行。",
+        url="https://playwildcard.com", status="speculative",
+        requirements=["ゲームプレイ", "NFT保有"],
+        source="curated", confidence=65,
+    ),
+    AirdropInfo(
+        name="MapleStory Universe",
+        chain="avalanche", category="gamefi",
+        description="MapleStoryのWeb3版。Nexon開発。テストネット進行中。",
+        url="https://maplestoryuniverse.com", status="speculative",
+        requirements=["テストネット参加", "ゲームプレイ"],
+        source="curated", confidence=72,
+    ),
+    AirdropInfo(
+        name="Off The Grid",
+        chain="avalanche", category="gamefi",
+        description="バトルロイヤルFPS。Gunzillaチーム。GUN追加配布期待。",
+        url="https://offthegrid.fun", status="active",
+        requirements=["ゲームプレイ", "ランク上げ"],
+        source="curated", confidence=68,
+    ),
+    AirdropInfo(
+        name="Xai Games",
+        chain="arbitrum", category="gamefi",
+        description="Arbitrum上のゲーム専用L3。XAI追加配布・ノード報酬。",
+        url="https://xai.games", status="active",
+        requirements=["ゲームプレイ", "ノード運用", "ステーキング"],
+        source="curated", confidence=72,
+    ),
+    AirdropInfo(
+        name="Ronin Network Season 2",
+        chain="ronin", category="gamefi",
+        description="Axie Infinityチェーン。RON追加配布。ゲーム・DeFi利用で対象。",
+        url="https://roninchain.com", status="upcoming",
+        requirements=["ブリッジ利用", "DeFi利用", "ゲームプレイ"],
+        source="curated", confidence=72,
+    ),
+    AirdropInfo(
+        name="Immutable zkEVM",
+        chain="ethereum", category="gamefi",
+        description="ゲーム特化L2。IMX追加配布。ゲーム利用・NFT取引で対象。",
+        url="https://immutable.com", status="active",
+        requirements=["ゲームプレイ", "NFT取引", "ブリッジ利用"],
+        source="curated", confidence=75,
+    ),
+    AirdropInfo(
+        name="Beam (Merit Circle)",
+        chain="beam", category="gamefi",
+        description="ゲーム特化チェーン。BEAM追加配布。ゲームハブ利用で対象。",
+        url="https://beam.eco", status="active",
+        requirements=["ゲームプレイ", "ステーキング"],
+        source="curated", confidence=68,
+    ),
+    AirdropInfo(
+        name="Treasure DAO",
+        chain="arbitrum", category="gamefi",
+        description="ゲームエコシステム。MAGIC追加配布。Bridgeworld・Smolverse。",
+        url="https://treasure.lol", status="upcoming",
+        requirements=["ゲームプレイ", "MAGICステーキング"],
+        source="curated", confidence=62,
+    ),
+    AirdropInfo(
+        name="Gala Games Season 2",
+        chain="ethereum", category="gamefi",
+        description="大手Web3ゲームプラットフォーム。GALA追加配布・ノード報酬。",
+        url="https://gala.games", status="upcoming",
+        requirements=["ゲームプレイ", "ノード運用"],
+        source="curated", confidence=60,
+    ),
+    AirdropInfo(
+        name="Apeiron",
+        chain="ronin", category="gamefi",
+        description="ゴッドゲーム×ローグライク。NFT惑星保有で報酬。",
+        url="https://apeironnft.com", status="active",
+        requirements=["ゲームプレイ", "惑星NFT保有"],
+        source="curated", confidence=58,
+    ),
+
+    # ─── インフラ ───
+    AirdropInfo(
+        name="Grass Season 2",
+        chain="solana", category="infra",
+        description="分散型AIデータネットワーク。帯域共有でポイント獲得。",
+        url="https://getgrass.io", status="active",
+        requirements=["ブラウザ拡張インストール", "帯域共有"],
+        source="curated", confidence=78,
+    ),
+    AirdropInfo(
+        name="LayerZero Season 2",
+        chain="multi", category="infra",
+        description="オムニチェーンプロトコル。ZRO追加配布期待。クロスチェーン利用で対象。",
+        url="https://layerzero.network", status="upcoming",
+        requirements=["クロスチェーン送金", "dApp利用"],
+        source="curated", confidence=72,
+    ),
+    AirdropInfo(
+        name="Wormhole Season 2",
+        chain="multi", category="infra",
+        description="クロスチェーンブリッジ。W追加配布期待。ブリッジ利用で対象。",
+        url="https://wormhole.com", status="upcoming",
+        requirements=["ブリッジ利用", "マルチチェーン送金"],
+        source="curated", confidence=68,
+    ),
+    AirdropInfo(
+        name="Initia",
+        chain="cosmos", category="infra",
+        description="モジュラーL1。テストネット進行中。$7.5M調達。",
+        url="https://initia.xyz", status="speculative",
+        requirements=["テストネット参加", "バリデータ運用"],
+        source="curated", confidence=75,
+    ),
+    AirdropInfo(
+        name="Avail",
+        chain="multi", category="infra",
+        description="データ可用性レイヤー。AVAIL追加配布期待。",
+        url="https://availproject.org", status="upcoming",
+        requirements=["テストネット参加", "ライトノード運用"],
+        source="curated", confidence=72,
+    ),
+    AirdropInfo(
+        name="Celestia Season 2",
+        chain="celestia", category="infra",
+        description="モジュラーDA。TIA追加配布期待。ステーキングで対象。",
+        url="https://celestia.org", status="upcoming",
+        requirements=["TIAステーキング", "ガバナンス参加"],
+        source="curated", confidence=72,
+    ),
+
+    # ─── ソーシャル / AI ───
+    AirdropInfo(
+        name="Farcaster",
+        chain="base", category="social",
+        description="分散型SNS。トークン未発行。アクティブ利用で対象。",
+        url="https://farcaster.xyz", status="speculative",
+        requirements=["アカウント作成", "投稿・いいね", "チャンネル参加"],
+        source="curated", confidence=78,
+    ),
+    AirdropInfo(
+        name="Lens Protocol V2",
+        chain="polygon", category="social",
+        description="分散型ソーシャルグラフ。Aave チーム。トークン未発行。",
+        url="https://lens.xyz", status="speculative",
+        requirements=["プロフィール作成", "投稿・コメント"],
+        source="curated", confidence=72,
+    ),
+    AirdropInfo(
+        name="io.net",
+        chain="solana", category="infra",
+        description="分散型GPU。IO追加配布期待。GPU提供・利用で対象。",
+        url="https://io.net", status="upcoming",
+        requirements=["GPU提供", "コンピュート利用"],
+        source="curated", confidence=68,
+    ),
+    AirdropInfo(
+        name="Render Network Season 2",
+        chain="solana", category="infra",
+        description="分散型GPUレンダリング。RNDR追加配布期待。",
+        url="https://rendernetwork.com", status="upcoming",
+        requirements=["GPU提供", "レンダリング利用"],
+        source="curated", confidence=62,
+    ),
+)
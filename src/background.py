@@ -11,16 +11,67 @@
 import asyncio
 import logging
 import re
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Awaitable, Callable, Optional, TypeVar
 
 import aiohttp
 from bs4 import BeautifulSoup
 
+from .config import config
+from .fetch import HostLimiter, TTLCache, cache_key, first_successful, raise_for_retry, read_json, with_retry
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+NITTER_TIMEOUT = aiohttp.ClientTimeout(total=8)
+NITTER_CHUNK_SIZE = 8192
+BROWSER_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+# github.com/<org>[/<repo>]
+GITHUB_URL_RE = re.compile(r'github\.com/([^/]+)(?:/([^/]+))?')
+
+# lxml はオプション依存（C実装のパーサ。未インストール時は html.parser）
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+async def _json_if_ok(resp: aiohttp.ClientResponse) -> Optional[Any]:
+    """200ならJSON、それ以外は None"""
+    return await read_json(resp) if resp.status == 200 else None
+
+
+async def _text_if_ok(resp: aiohttp.ClientResponse) -> Optional[str]:
+    """200ならテキスト、それ以外は None"""
+    return await resp.text() if resp.status == 200 else None
+
+
+async def _read_until_bio(resp: aiohttp.ClientResponse) -> Optional[str]:
+    """
+    Nitter プロフィールHTMLを .profile-bio の閉じタグまでだけ読む
+    （bio より後ろのタイムライン部分は数百KBあるのでダウンロード・パースしない）
+    """
+    if resp.status != 200:
+        return None
+    buf = bytearray()
+    bio_at = -1
+    async for chunk in resp.content.iter_chunked(NITTER_CHUNK_SIZE):
+        buf += chunk
+        if bio_at < 0:
+            bio_at = buf.find(b"profile-bio")
+        if bio_at >= 0 and buf.find(b"</div>", bio_at) >= 0:
+            break
+    return buf.decode(resp.charset or "utf-8", errors="replace")
+
 
-@dataclass
+@dataclass(slots=True)
 class TeamMember:
     name: str
     role: str = ""
@@ -30,14 +81,14 @@ class TeamMember:
     is_doxxed: bool = False  # 本人確認済みか
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingInfo:
     total_raised: float = 0.0  # USD
     investors: list = field(default_factory=list)
     rounds: list = field(default_factory=list)  # [{"round": "seed", "amount": 5000000, "date": "2024-03"}]
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectBackground:
     """プロジェクト背景レポート"""
     # 基本情報
@@ -87,15 +138,64 @@ class ProjectBackground:
 
 
 class BackgroundInvestigator:
-    """プロジェクトの背景を自動調査"""
+    """
+    プロジェクトの背景を自動調査
+    session は fetch.create_session() で作った共有セッションを渡し、
+    複数回の investigate() で使い回すこと（接続プール / DNSキャッシュが効く）
+    """
 
     NITTER_INSTANCES = [
         "https://nitter.privacydev.net",
         "https://nitter.poast.org",
     ]
+    # 1ホストあたりの同時リクエスト上限（複数プロジェクトを並行調査しても偏らない）
+    PER_HOST_LIMIT = 4
+    # investigate_many で同時に調査するプロジェクト数
+    BATCH_CONCURRENCY = 16
+
+    # ── キーワード（小文字の部分一致。呼び出しごとにリストを作らない） ──
+    # Twitter bio: Doxxed判定のヒント / VCバッキングヒント
+    BIO_TEAM_KEYWORDS = ("team", "founded by", "ceo", "co-founder", "built by")
+    BIO_VC_KEYWORDS = ("backed by", "invested", "a16z", "paradigm", "polychain",
+                       "multicoin", "jump", "alameda", "solana ventures")
+    # ウェブサイト: チームセクション / 投資家名
+    SITE_TEAM_KEYWORDS = ("team", "founders", "about us")
+    SITE_VC_NAMES = ("a16z", "paradigm", "polychain", "multicoin", "jump crypto",
+                     "solana ventures", "coinbase ventures", "binance labs",
+                     "sequoia", "dragonfly", "pantera")
+    # 本文テキストを持たないタグ（インラインJS/CSS/SVGはページの大半を占めることがある）
+    SITE_STRIP_TAGS = ("script", "style", "noscript", "svg", "template")
+
+    # CoinGecko /coins/{id}: 使うのは community / developer / links だけ。
+    # tickers・market_data・多言語説明を切ると本文は ~10KB になり、丸ごと orjson で読む方が速い
+    COINGECKO_DETAIL_PARAMS = {
+        "localization": "false", "tickers": "false", "market_data": "false",
+        "community_data": "true", "developer_data": "true", "sparkline": "false",
+    }
+
+    # CoinGecko 検索/詳細は数分で変わらないので、重複する調査ではキャッシュを返す
+    COINGECKO_CACHE_TTL = 600
+
+    # ── 信頼度スコアの段階表（TIERS[i] を超えると BONUS[i+1]） ──
+    TEAM_SIZE_TIERS = (2, 5)                  # 以上
+    TEAM_SIZE_BONUS = (0, 5, 10)
+    RAISED_TIERS = (1_000_000, 5_000_000)     # 超
+    RAISED_BONUS = (0, 5, 10)
+    COMMITS_TIERS = (0, 10, 50)               # 超
+    COMMITS_BONUS = (0, 5, 10, 15)
+
+    # DeFiLlama /protocols は数MBあるため全インスタンスで共有キャッシュ
+    # (取得時刻, {小文字名: protocol}, {category: [Solana上のプロトコル名]}, {検索名: protocol})
+    LLAMA_CACHE_TTL = 600
+    _llama_cache: Optional[tuple[float, dict, dict, dict]] = None
+    _llama_lock = asyncio.Lock()
 
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
+        self._host_limit = HostLimiter(self.PER_HOST_LIMIT)
+        self._response_cache = TTLCache()
+        # GitHub 条件付きGET用: {url: (ETag, パース済みボディ)}
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
 
     async def investigate(self, name: str, website: str = "",
                           twitter_handle: str = "", github_url: str = "",
@@ -118,14 +218,56 @@ class BackgroundInvestigator:
 
         return bg
 
+    async def investigate_many(self, projects: list[dict]) -> list[ProjectBackground]:
+        """
+        複数プロジェクトを一括調査（入力順で返す）
+        projects: investigate() のキーワード引数の dict（name 必須）
+        """
+        # 全件で共有する DeFiLlama 索引を先に1回だけ取得
+        try:
+            await self._llama_index()
+        except Exception as e:
+            logger.debug(f"DeFiLlama prefetch error: {e}")
+
+        sem = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+
+        async def _one(project: dict) -> ProjectBackground:
+            async with sem:
+                return await self.investigate(**project)
+
+        return list(await asyncio.gather(*(_one(p) for p in projects)))
+
+    async def _get(self, url: str,
+                   handle: Callable[[aiohttp.ClientResponse], Awaitable[T]],
+                   **kwargs) -> T:
+        """
+        共通GET: ホスト単位の同時実行制限 + 一時的な失敗（429/5xx/接続エラー）の再試行
+        レスポンスの解釈（ステータス判定・デコード）は handle に任せる
+        """
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+
+        async def _once() -> T:
+            async with self._host_limit(url):
+                async with self.session.get(url, **kwargs) as resp:
+                    raise_for_retry(resp)
+                    return await handle(resp)
+
+        return await with_retry(_once)
+
+    async def _get_json_cached(self, url: str, ttl: float, **kwargs) -> Optional[Any]:
+        """_get の JSON 版を URL+params 単位でTTLキャッシュ（200以外は None でキャッシュしない）"""
+        return await self._response_cache.get_or_load(
+            cache_key(url, kwargs.get("params")), ttl,
+            lambda: self._get(url, _json_if_ok, **kwargs),
+        )
+
     async def _check_coingecko(self, name: str, bg: ProjectBackground):
         """CoinGecko APIでプロジェクト情報・資金調達を確認"""
         try:
             search_url = f"https://api.coingecko.com/api/v3/search?query={name}"
-            async with self.session.get(search_url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status != 200:
-                    return
-                data = await resp.json()
+            data = await self._get_json_cached(search_url, self.COINGECKO_CACHE_TTL)
+            if not data:
+                return
 
             coins = data.get("coins", [])
             if not coins:
@@ -137,13 +279,10 @@ class BackgroundInvestigator:
 
             # 詳細取得
             detail_url = f"https://api.coingecko.com/api/v3/coins/{coin_id}"
-            params = {"localization": "false", "tickers": "false", "market_data": "false",
-                      "community_data": "true", "developer_data": "true"}
-            async with self.session.get(detail_url, params=params,
-                                         timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status != 200:
-                    return
-                detail = await resp.json()
+            detail = await self._get_json_cached(detail_url, self.COINGECKO_CACHE_TTL,
+                                                 params=self.COINGECKO_DETAIL_PARAMS)
+            if not detail:
+                return
 
             # コミュニティデータ
             community = detail.get("community_data", {})
@@ -181,34 +320,65 @@ class BackgroundInvestigator:
     async def _check_defillama(self, name: str, bg: ProjectBackground):
         """DeFiLlamaでTVL・エコシステム情報確認"""
         try:
-            url = "https://api.llama.fi/protocols"
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status != 200:
-                    return
-                data = await resp.json()
-
-            for protocol in data:
-                if name.lower() in protocol.get("name", "").lower():
-                    tvl = protocol.get("tvl", 0) or 0
-                    chains = protocol.get("chains", [])
-                    category = protocol.get("category", "")
-
-                    bg.ecosystem = category
-                    bg.related_projects = [
-                        p.get("name") for p in data
-                        if category and p.get("category") == category
-                        and "Solana" in p.get("chains", [])
-                    ][:5]
-
-                    if tvl > 10_000_000:
-                        bg.has_vc_backing = True  # 高TVL = 資金バックあり推定
-
-                    logger.info(f"  DeFiLlama: TVL=${tvl:,.0f}, category={category}")
-                    break
+            index = await self._llama_index()
+            if index is None:
+                return
+            by_name, solana_by_category, matches = index
+
+            name_lower = name.lower()
+            if name_lower in matches:
+                protocol = matches[name_lower]
+            else:
+                protocol = by_name.get(name_lower)
+                if protocol is None:
+                    # 完全一致が無ければ名前の部分一致（キーのみ走査）
+                    protocol = next(
+                        (p for key, p in by_name.items() if name_lower in key), None
+                    )
+                matches[name_lower] = protocol  # 不一致(None)も記録して再走査しない
+            if protocol is None:
+                return
+
+            tvl = protocol.get("tvl", 0) or 0
+            category = protocol.get("category", "")
+
+            bg.ecosystem = category
+            if category:
+                bg.related_projects = solana_by_category.get(category, [])[:5]
+
+            if tvl > 10_000_000:
+                bg.has_vc_backing = True  # 高TVL = 資金バックあり推定
+
+            logger.info(f"  DeFiLlama: TVL=${tvl:,.0f}, category={category}")
 
         except Exception as e:
             logger.debug(f"DeFiLlama error: {e}")
 
+    async def _llama_index(self) -> Optional[tuple[dict, dict, dict]]:
+        """DeFiLlama /protocols の索引を返す（TTL内はキャッシュ、取得失敗時は None）"""
+        cls = BackgroundInvestigator
+        async with cls._llama_lock:
+            cached = cls._llama_cache
+            if cached and time.monotonic() - cached[0] < self.LLAMA_CACHE_TTL:
+                return cached[1:]
+
+            data = await self._get("https://api.llama.fi/protocols", _json_if_ok)
+            if data is None:
+                return None
+
+            by_name: dict = {}
+            solana_by_category: dict = defaultdict(list)
+            for p in data:
+                by_name.setdefault(p.get("name", "").lower(), p)
+                category = p.get("category")
+                if category and "Solana" in p.get("chains", []):
+                    solana_by_category[category].append(p.get("name"))
+
+            # 検索名 -> 一致した protocol（None=不一致）。索引と同じ寿命
+            matches: dict = {}
+            cls._llama_cache = (time.monotonic(), by_name, solana_by_category, matches)
+            return by_name, solana_by_category, matches
+
     async def _check_github_team(self, github_url: str, bg: ProjectBackground):
         """GitHubから開発チーム情報を取得"""
         if not github_url:
@@ -216,75 +386,99 @@ class BackgroundInvestigator:
 
         try:
             # org/repo形式を抽出
-            match = re.search(r'github\.com/([^/]+)(?:/([^/]+))?', github_url)
+            match = GITHUB_URL_RE.search(github_url)
             if not match:
                 return
 
             org = match.group(1)
+            repo = match.group(2) if match.group(2) else ""
+
+            # org members と最近のコミットを同時に取得
+            fetches = [self._github_get(f"https://api.github.com/orgs/{org}/members")]
+            if repo:
+                fetches.append(self._github_get(
+                    f"https://api.github.com/repos/{org}/{repo}/commits?per_page=30"
+                ))
+            results = await asyncio.gather(*fetches)
 
-            # org membersを取得
-            members_url = f"https://api.github.com/orgs/{org}/members"
-            async with self.session.get(members_url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status == 200:
-                    members = await resp.json()
-                    bg.team_size_estimate = len(members)
+            members = results[0]
+            if members is not None:
+                bg.team_size_estimate = len(members)
 
-                    for m in members[:5]:
-                        bg.team.append(TeamMember(
-                            name=m.get("login", ""),
-                            github=m.get("html_url", ""),
-                        ))
+                for m in members[:5]:
+                    bg.team.append(TeamMember(
+                        name=m.get("login", ""),
+                        github=m.get("html_url", ""),
+                    ))
 
             # 最近のコミット活動
-            repo = match.group(2) if match.group(2) else ""
-            if repo:
-                commits_url = f"https://api.github.com/repos/{org}/{repo}/commits?per_page=30"
-                async with self.session.get(commits_url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                    if resp.status == 200:
-                        commits = await resp.json()
-                        unique_authors = set()
-                        for c in commits:
-                            author = c.get("author", {})
-                            if author:
-                                unique_authors.add(author.get("login", ""))
-                        bg.github_health["active_devs_30d"] = len(unique_authors)
+            commits = results[1] if repo else None
+            if commits is not None:
+                unique_authors = set()
+                for c in commits:
+                    author = c.get("author", {})
+                    if author:
+                        unique_authors.add(author.get("login", ""))
+                bg.github_health["active_devs_30d"] = len(unique_authors)
 
         except Exception as e:
             logger.debug(f"GitHub team error: {e}")
 
+    async def _github_get(self, url: str) -> Optional[Any]:
+        """GitHub APIを条件付きGETで取得（304ならキャッシュを返す、失敗時は None）"""
+        headers = {"Accept": "application/vnd.github+json"}
+        if config.github_token:
+            headers["Authorization"] = f"Bearer {config.github_token}"
+        cached = self._etag_cache.get(url)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        async def _handle(resp: aiohttp.ClientResponse) -> Optional[Any]:
+            if resp.status == 304 and cached:
+                return cached[1]
+            if resp.status != 200:
+                return None
+            body = await read_json(resp)
+            etag = resp.headers.get("ETag")
+            if etag:
+                self._etag_cache[url] = (etag, body)
+            return body
+
+        return await self._get(url, _handle, headers=headers)
+
     async def _check_twitter_team(self, handle: str, bg: ProjectBackground):
         """Nitter経由でTwitterプロフィールからチーム情報を推定"""
         if not handle:
             return
 
-        for inst in self.NITTER_INSTANCES:
-            try:
-                url = f"{inst}/{handle}"
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=8),
-                                             headers={"User-Agent": "Mozilla/5.0"}) as resp:
-                    if resp.status != 200:
-                        continue
-                    html = await resp.text()
-
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Bio分析
-                bio = soup.select_one(".profile-bio")
-                if bio:
-                    bio_text = bio.get_text(strip=True).lower()
-                    # Doxxed判定のヒント
-                    if any(kw in bio_text for kw in ["team", "founded by", "ceo", "co-founder", "built by"]):
-                        bg.team_doxxed = True
-
-                    # VCバッキングヒント
-                    vc_keywords = ["backed by", "invested", "a16z", "paradigm", "polychain",
-                                   "multicoin", "jump", "alameda", "solana ventures"]
-                    if any(kw in bio_text for kw in vc_keywords):
-                        bg.has_vc_backing = True
-
-                break
-            except Exception:
-                continue
+        # ミラーは不安定なので上位2つへ同時に投げ、先に成功した方を使う
+        html = await first_successful(
+            self._fetch_nitter(inst, handle) for inst in self.NITTER_INSTANCES[:2]
+        )
+        if not html:
+            return
+
+        try:
+            soup = BeautifulSoup(html, HTML_PARSER)
+
+            # Bio分析
+            bio = soup.select_one(".profile-bio")
+            if bio:
+                bio_text = bio.get_text(strip=True).lower()
+                # Doxxed判定のヒント
+                if any(kw in bio_text for kw in self.BIO_TEAM_KEYWORDS):
+                    bg.team_doxxed = True
+
+                # VCバッキングヒント
+                if any(kw in bio_text for kw in self.BIO_VC_KEYWORDS):
+                    bg.has_vc_backing = True
+        except Exception as e:
+            logger.debug(f"Twitter team error: {e}")
+
+    async def _fetch_nitter(self, instance: str, handle: str) -> Optional[str]:
+        """Nitter ミラー1つからプロフィールHTMLを取得（失敗時は None）"""
+        return await self._get(f"{instance}/{handle}", _read_until_bio,
+                               timeout=NITTER_TIMEOUT, headers=BROWSER_HEADERS)
 
     async def _check_website(self, url: str, bg: ProjectBackground):
         """ウェブサイトからチーム/投資家情報を抽出"""
@@ -292,24 +486,21 @@ class BackgroundInvestigator:
             return
 
         try:
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10),
-                                         headers={"User-Agent": "Mozilla/5.0"}) as resp:
-                if resp.status != 200:
-                    return
-                html = await resp.text()
+            html = await self._get(url, _text_if_ok, headers=BROWSER_HEADERS)
+            if not html:
+                return
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, HTML_PARSER)
+            for tag in soup(self.SITE_STRIP_TAGS):
+                tag.decompose()
             text = soup.get_text().lower()
 
             # チームセクション検出
-            if any(kw in text for kw in ["team", "founders", "about us"]):
+            if any(kw in text for kw in self.SITE_TEAM_KEYWORDS):
                 bg.team_doxxed = True
 
             # 投資家検出
-            vc_names = ["a16z", "paradigm", "polychain", "multicoin", "jump crypto",
-                        "solana ventures", "coinbase ventures", "binance labs",
-                        "sequoia", "dragonfly", "pantera"]
-            found_vcs = [vc for vc in vc_names if vc in text]
+            found_vcs = [vc for vc in self.SITE_VC_NAMES if vc in text]
             if found_vcs:
                 bg.has_vc_backing = True
                 bg.funding.investors = found_vcs
@@ -323,33 +514,19 @@ class BackgroundInvestigator:
         score = 30  # ベース
 
         # チーム（+25）
-        if bg.team_doxxed:
-            score += 15
-        if bg.team_size_estimate >= 5:
-            score += 10
-        elif bg.team_size_estimate >= 2:
-            score += 5
+        score += 15 * bg.team_doxxed
+        score += self.TEAM_SIZE_BONUS[bisect_right(self.TEAM_SIZE_TIERS, bg.team_size_estimate)]
 
         # 資金（+25）
-        if bg.has_vc_backing:
-            score += 15
-        if bg.funding.total_raised > 5_000_000:
-            score += 10
-        elif bg.funding.total_raised > 1_000_000:
-            score += 5
+        score += 15 * bg.has_vc_backing
+        score += self.RAISED_BONUS[bisect_left(self.RAISED_TIERS, bg.funding.total_raised)]
 
         # 開発活動（+20）
-        commits = bg.github_health.get("commits_4w", 0)
-        if commits > 50:
-            score += 15
-        elif commits > 10:
-            score += 10
-        elif commits > 0:
-            score += 5
-
-        contributors = bg.github_health.get("contributors", 0)
-        if contributors > 5:
-            score += 5
+        commits = bg.github_health.get("commits_4w", 0) or 0
+        score += self.COMMITS_BONUS[bisect_left(self.COMMITS_TIERS, commits)]
+
+        contributors = bg.github_health.get("contributors", 0) or 0
+        score += 5 * (contributors > 5)
 
         # レッドフラグ（減点）
         if bg.is_fork:
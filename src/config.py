@@ -1,80 +1,151 @@
 """設定管理 — v5.8 信頼性チェック強化版"""
+import functools
 import os
-from dataclasses import dataclass, field
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# 真とみなす bool 環境変数の値（大文字小文字は無視）
+_TRUE = frozenset({"1", "true", "yes", "on"})
+
+# 型ごとの環境変数パーサ
+_ENV_PARSERS = {
+    str: str,
+    int: int,
+    float: float,
+    bool: lambda v: v.strip().lower() in _TRUE,
+}
+
+# フィールド名の大文字と異なる環境変数名
+_ENV_NAMES = {
+    "realtime_interval": "REALTIME_INTERVAL_MINUTES",
+}
+
+# リスト型設定の1エントリ: "addr" または "addr:label"（カンマ区切り、前後の空白は無視）
+_LABELED_ITEM_RE = re.compile(r"(?:^|,)\s*([^,:\s]+)\s*(?::([^,]*))?")
+
+
+def parse_list(raw: str) -> tuple[str, ...]:
+    """カンマ区切りの設定値をタプルに（前後の空白・空要素は除く）"""
+    return tuple(item for item in (s.strip() for s in raw.split(",")) if item)
+
+
+def parse_labeled_list(raw: str, default_label: str) -> dict[str, str]:
+    """"addr:label,addr2" 形式の設定値を {addr: label} に（ラベル省略 / 空なら default_label）"""
+    return {
+        m.group(1): (m.group(2) or "").strip() or default_label
+        for m in _LABELED_ITEM_RE.finditer(raw)
+    }
+
+
+# ── スコアリングの重み（合計 1.0）──
+# v5.8: ソーシャル信頼性15% + 安全性データ15% を新設
+DEFAULT_WEIGHTS: Mapping[str, float] = MappingProxyType({
+    "liquidity":        0.18,   # 流動性
+    "volume":           0.18,   # 取引量
+    "price_change":     0.12,   # 価格変動
+    "tx_count":         0.10,   # TX数
+    "makers":           0.10,   # ユニークトレーダー数
+    "social_presence":  0.15,   # ソーシャル信頼性（Twitter/Web/Discord/TG）
+    "safety_score":     0.15,   # 安全性データ（LP lock/Mint/Holders）
+    "age_bonus":        0.02,   # ペア年齢
+})
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     # ── 通知先 ──
-    discord_webhook_url: str = os.getenv("DISCORD_WEBHOOK_URL", "")
-    telegram_bot_token: str = os.getenv("TELEGRAM_BOT_TOKEN", "")
-    telegram_chat_id: str = os.getenv("TELEGRAM_CHAT_ID", "")
-    line_notify_token: str = os.getenv("LINE_NOTIFY_TOKEN", "")
+    discord_webhook_url: str = ""
+    telegram_bot_token: str = ""
+    telegram_chat_id: str = ""
+    line_notify_token: str = ""
+    discord_bot_token: str = ""
 
     # ── API キー（任意） ──
-    github_token: str = os.getenv("GITHUB_TOKEN", "")
-    helius_api_key: str = os.getenv("HELIUS_API_KEY", "")
+    github_token: str = ""
+    helius_api_key: str = ""
 
     # ── 機能トグル ──
-    enable_pumpfun: bool = os.getenv("ENABLE_PUMPFUN", "true").lower() == "true"
-    enable_nft: bool = os.getenv("ENABLE_NFT", "false").lower() == "true"
-    enable_mania_scoring: bool = os.getenv("ENABLE_MANIA_SCORING", "true").lower() == "true"
-    enable_smart_money: bool = os.getenv("ENABLE_SMART_MONEY", "true").lower() == "true"
+    enable_pumpfun: bool = True
+    enable_nft: bool = False
+    enable_mania_scoring: bool = True
+    enable_smart_money: bool = True
 
     # ── リアルタイム監視 ──
-    realtime_interval: int = int(os.getenv("REALTIME_INTERVAL_MINUTES", "5"))
-    daily_report_hour: int = int(os.getenv("DAILY_REPORT_HOUR", "9"))
+    realtime_interval: int = 5
+    daily_report_hour: int = 9
 
     # ── Copy ウォレット: "addr1:ラベル1,addr2:ラベル2" ──
-    watch_wallets: str = os.getenv("WATCH_WALLETS", "")
+    watch_wallets: str = ""
 
     # ── 流動性監視トークン: "addr1,addr2" ──
-    watch_tokens: str = os.getenv("WATCH_TOKENS", "")
+    watch_tokens: str = ""
 
     # ── SOL レンジ ──
-    sol_range_low: float = float(os.getenv("SOL_RANGE_LOW", "0"))
-    sol_range_high: float = float(os.getenv("SOL_RANGE_HIGH", "0"))
+    sol_range_low: float = 0.0
+    sol_range_high: float = 0.0
 
     # ── NFT 監視: "mad_lads,tensorians" ──
-    watch_nfts: str = os.getenv("WATCH_NFTS", "")
+    watch_nfts: str = ""
 
     # ── スクリーニング設定 ──
-    top_n: int = int(os.getenv("TOP_N", "7"))
-    scan_interval_minutes: int = int(os.getenv("SCAN_INTERVAL_MINUTES", "60"))
-    morning_scan_hour: int = int(os.getenv("MORNING_SCAN_HOUR", "7"))
-    min_liquidity_usd: float = float(os.getenv("MIN_LIQUIDITY_USD", "10000"))
-    min_volume_24h_usd: float = float(os.getenv("MIN_VOLUME_24H_USD", "5000"))
-    scan_hours_back: int = int(os.getenv("SCAN_HOURS_BACK", "12"))
+    top_n: int = 7
+    scan_interval_minutes: int = 60
+    morning_scan_hour: int = 7
+    min_liquidity_usd: float = 10_000.0
+    min_volume_24h_usd: float = 5000.0
+    scan_hours_back: int = 12
 
     # ── 品質フィルタ閾値（v5.5 強化） ──
-    min_mcap_usd: float = float(os.getenv("MIN_MCAP_USD", "30000"))
-    min_tx_count_24h: int = int(os.getenv("MIN_TX_COUNT_24H", "100"))
-    min_makers_24h: int = int(os.getenv("MIN_MAKERS_24H", "30"))
-    max_price_drop_24h: float = float(os.getenv("MAX_PRICE_DROP_24H", "-70"))
+    min_mcap_usd: float = 30_000.0
+    min_tx_count_24h: int = 100
+    min_makers_24h: int = 30
+    max_price_drop_24h: float = -70.0
 
     # ── 安全性フィルタ閾値 ──
-    danger_auto_exclude: bool = os.getenv("DANGER_AUTO_EXCLUDE", "true").lower() == "true"
+    danger_auto_exclude: bool = True
 
     # ── 信頼性チェック閾値（v5.8） ──
-    top_holders_danger_pct: float = float(os.getenv("TOP_HOLDERS_DANGER_PCT", "50"))
-    top_holders_warn_pct: float = float(os.getenv("TOP_HOLDERS_WARN_PCT", "30"))
-    insider_danger_count: int = int(os.getenv("INSIDER_DANGER_COUNT", "3"))
-
-    # ── スコアリングの重み（合計 1.0）──
-    # v5.8: ソーシャル信頼性15% + 安全性データ15% を新設
-    weights: dict = field(default_factory=lambda: {
-        "liquidity":        0.18,   # 流動性
-        "volume":           0.18,   # 取引量
-        "price_change":     0.12,   # 価格変動
-        "tx_count":         0.10,   # TX数
-        "makers":           0.10,   # ユニークトレーダー数
-        "social_presence":  0.15,   # ソーシャル信頼性（Twitter/Web/Discord/TG）
-        "safety_score":     0.15,   # 安全性データ（LP lock/Mint/Holders）
-        "age_bonus":        0.02,   # ペア年齢
-    })
-
-
-config = Config()
+    top_holders_danger_pct: float = 50.0
+    top_holders_warn_pct: float = 30.0
+    insider_danger_count: int = 3
+
+    # ── スコアリングの重み（読み取り専用・全インスタンスで共有）──
+    weights: Mapping[str, float] = field(default_factory=lambda: DEFAULT_WEIGHTS)
+
+    @property
+    def rpc_url(self) -> str:
+        """Solana RPC（Helius キーがあれば Helius、なければ公開RPC）"""
+        if self.helius_api_key:
+            return f"https://mainnet.helius-rpc.com/?api-key={self.helius_api_key}"
+        return "https://api.mainnet-beta.solana.com"
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """
+        環境変数（.env 読み込み済み）から生成
+        未設定のフィールドはクラスのデフォルト値。既定の環境変数名はフィールド名の大文字
+        """
+        kwargs = {}
+        for f in fields(cls):
+            parse = _ENV_PARSERS.get(f.type)
+            if parse is None:
+                continue
+            raw = os.environ.get(_ENV_NAMES.get(f.name, f.name.upper()))
+            if raw is not None:
+                kwargs[f.name] = parse(raw)
+        return cls(**kwargs)
+
+
+@functools.cache
+def get_config() -> Config:
+    """プロセス共通の設定（初回のみ環境変数を読む。テストでは get_config.cache_clear() で作り直す）"""
+    return Config.from_env()
+
+
+config = get_config()
@@ -16,10 +16,11 @@ Webhook通知と並行して動作する。
 """
 import asyncio
 import logging
-import os
 from datetime import datetime, timezone
 from typing import Optional, Callable, Awaitable
 
+from .config import config
+
 logger = logging.getLogger(__name__)
 
 # discord.py はオプション依存
@@ -31,6 +32,39 @@ except ImportError:
     DISCORD_PY_AVAILABLE = False
     logger.info("Discord Bot: discord.py 未インストール（Bot機能は無効）")
 
+_COLOR_INFO = 0x5865F2
+_COLOR_OK = 0x00FF88
+_FOOTER = "Sol Screener v5.6"
+
+# 呼び出しごとに変わらない embed 部分（timestamp / fields は送信時に付与）
+_SCAN_EMBED_TEMPLATE = {
+    "title": "🔍 スキャン完了",
+    "description": "フルスキャンを実行しました。結果は通知チャンネルに送信されます。",
+    "color": _COLOR_INFO,
+}
+_FILTER_EMBED_TEMPLATE = {
+    "title": "⚙️ 現在のフィルタ条件",
+    "color": _COLOR_INFO,
+    "footer": {"text": f"{_FOOTER} | Railway環境変数で変更可能"},
+}
+_STATUS_EMBED_TEMPLATE = {
+    "title": "📊 Bot ステータス",
+    "color": _COLOR_OK,
+    "footer": {"text": _FOOTER},
+}
+
+# /filter の表示項目（名前, info を埋め込む値テンプレート）
+_FILTER_FIELDS = (
+    ("💰 時価総額 (MC)", "≥ ${min_mcap:,.0f}"),
+    ("💧 流動性 (Liq)", "≥ ${min_liquidity:,.0f}"),
+    ("📊 取引量 (Vol)", "≥ ${min_volume:,.0f}"),
+    ("🔄 TX数", "≥ {min_tx}"),
+    ("👥 Makers数", "≥ {min_makers}"),
+    ("📉 暴落除外", "> {max_drop}%"),
+    ("⏰ 時間窓", "直近 {hours_back}時間"),
+    ("🏆 表示件数", "Top {top_n}"),
+)
+
 
 class DiscordBot:
     """
@@ -43,8 +77,10 @@ class DiscordBot:
     def __init__(self):
         self._client: Optional[object] = None
         self._tree: Optional[object] = None
-        self._token = os.getenv("DISCORD_BOT_TOKEN", "")
+        self._token = config.discord_bot_token
         self._running = False
+        # get_status_info 未注入時のみ使う StateManager（初回 /status で遅延生成し再利用）
+        self._state: Optional[object] = None
 
         # コールバック（main.pyから注入）
         self._on_scan: Optional[Callable[[], Awaitable]] = None
@@ -114,12 +150,10 @@ class DiscordBot:
                 if self._on_scan:
                     await self._on_scan()
                     await interaction.followup.send(
-                        embed=discord.Embed(
-                            title="🔍 スキャン完了",
-                            description="フルスキャンを実行しました。結果は通知チャンネルに送信されます。",
-                            color=0x5865F2,
-                            timestamp=datetime.now(timezone.utc),
-                        )
+                        embed=discord.Embed.from_dict(dict(
+                            _SCAN_EMBED_TEMPLATE,
+                            timestamp=datetime.now(timezone.utc).isoformat(),
+                        ))
                     )
                 else:
                     await interaction.followup.send("⚠️ スキャン機能が初期化されていません")
@@ -132,7 +166,6 @@ class DiscordBot:
             if self._get_filter_info:
                 info = self._get_filter_info()
             else:
-                from .config import config
                 info = {
                     "min_mcap": config.min_mcap_usd,
                     "min_liquidity": config.min_liquidity_usd,
@@ -144,52 +177,14 @@ class DiscordBot:
                     "top_n": config.top_n,
                 }
 
-            embed = discord.Embed(
-                title="⚙️ 現在のフィルタ条件",
-                color=0x5865F2,
-                timestamp=datetime.now(timezone.utc),
-            )
-            embed.add_field(
-                name="💰 時価総額 (MC)",
-                value=f"≥ ${info['min_mcap']:,.0f}",
-                inline=True,
-            )
-            embed.add_field(
-                name="💧 流動性 (Liq)",
-                value=f"≥ ${info['min_liquidity']:,.0f}",
-                inline=True,
-            )
-            embed.add_field(
-                name="📊 取引量 (Vol)",
-                value=f"≥ ${info['min_volume']:,.0f}",
-                inline=True,
-            )
-            embed.add_field(
-                name="🔄 TX数",
-                value=f"≥ {info['min_tx']}",
-                inline=True,
-            )
-            embed.add_field(
-                name="👥 Makers数",
-                value=f"≥ {info['min_makers']}",
-                inline=True,
-            )
-            embed.add_field(
-                name="📉 暴落除外",
-                value=f"> {info['max_drop']}%",
-                inline=True,
-            )
-            embed.add_field(
-                name="⏰ 時間窓",
-                value=f"直近 {info['hours_back']}時間",
-                inline=True,
-            )
-            embed.add_field(
-                name="🏆 表示件数",
-                value=f"Top {info['top_n']}",
-                inline=True,
-            )
-            embed.set_footer(text="Sol Screener v5.6 | Railway環境変数で変更可能")
+            embed = discord.Embed.from_dict(dict(
+                _FILTER_EMBED_TEMPLATE,
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                fields=[
+                    {"name": name, "value": value.format_map(info), "inline": True}
+                    for name, value in _FILTER_FIELDS
+                ],
+            ))
 
             await interaction.response.send_message(embed=embed)
 
@@ -200,30 +195,27 @@ class DiscordBot:
             else:
                 info = {}
 
-            from .state import StateManager
-            state = StateManager()
-
-            embed = discord.Embed(
-                title="📊 Bot ステータス",
-                color=0x00FF88,
-                timestamp=datetime.now(timezone.utc),
-            )
-            embed.add_field(
-                name="🤖 バージョン",
-                value="v5.6",
-                inline=True,
-            )
-            embed.add_field(
-                name="📋 通知済みトークン",
-                value=f"{state.get_notified_count()}件",
-                inline=True,
-            )
-            embed.add_field(
-                name="⏱️ 稼働状態",
-                value="✅ 正常稼働中",
-                inline=True,
-            )
-            embed.set_footer(text="Sol Screener v5.6")
+            # main.py の稼働中 StateManager の件数を優先（毎回ファイルを読み直さない）
+            notified_count = info.get("notified_count")
+            if notified_count is None:
+                if self._state is None:
+                    from .state import StateManager
+                    self._state = StateManager()
+                notified_count = self._state.get_notified_count()
+
+            embed = discord.Embed.from_dict(dict(
+                _STATUS_EMBED_TEMPLATE,
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                fields=[
+                    {"name": "🤖 バージョン", "value": "v5.6", "inline": True},
+                    {
+                        "name": "📋 通知済みトークン",
+                        "value": f"{notified_count}件",
+                        "inline": True,
+                    },
+                    {"name": "⏱️ 稼働状態", "value": "✅ 正常稼働中", "inline": True},
+                ],
+            ))
 
             await interaction.response.send_message(embed=embed)
 
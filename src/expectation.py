@@ -7,6 +7,7 @@ DexScreener のマーケットデータから、
 """
 import math
 import logging
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Optional
 
@@ -15,7 +16,7 @@ from .scanner import SolanaProject
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExpectationResult:
     """期待値計算結果"""
     symbol: str
@@ -46,15 +47,33 @@ class ExpectationCalculator:
     """トークンの期待値を計算"""
 
     # 時価総額レンジ別の成長確率（経験的パラメータ）
-    MCAP_GROWTH_PROBS = {
-        # (mcap_range, 2x_prob, 5x_prob, 10x_prob)
-        "micro":    (0, 100_000, 40, 15, 5),
-        "small":    (100_000, 1_000_000, 30, 10, 3),
-        "mid":      (1_000_000, 10_000_000, 20, 5, 1.5),
-        "large":    (10_000_000, 100_000_000, 10, 2, 0.5),
-        "mega":     (100_000_000, float("inf"), 5, 1, 0.2),
+    # MCAP_THRESHOLDS で区切ったレンジごとに (2x_prob, 5x_prob, 10x_prob)
+    MCAP_THRESHOLDS = (100_000, 1_000_000, 10_000_000, 100_000_000)
+    MCAP_GROWTH_PROBS = (
+        (40, 15, 5),      # micro: < $100K
+        (30, 10, 3),      # small: < $1M
+        (20, 5, 1.5),     # mid:   < $10M
+        (10, 2, 0.5),     # large: < $100M
+        (5, 1, 0.2),      # mega
+    )
+
+    # 安全性の risk_level ごとの確率倍率 (2x, 5x, 10x) と表示ラベル
+    RISK_ADJUSTMENTS = {
+        "danger":  ((0.3, 0.1, 0.05), "危険トークン(---)"),
+        "warning": ((0.7, 0.5, 1.0), "警告あり(-)"),
+        "safe":    ((1.1, 1.0, 1.0), "安全確認(+)"),
     }
 
+    def calculate_batch(
+        self,
+        projects: list[SolanaProject],
+        safeties: Optional[list[Optional[dict]]] = None,
+    ) -> list[ExpectationResult]:
+        """複数プロジェクトを一括計算（safeties は projects と同じ順序、省略可）"""
+        if safeties is None:
+            return [self.calculate(p) for p in projects]
+        return [self.calculate(p, s) for p, s in zip(projects, safeties)]
+
     def calculate(
         self,
         project: SolanaProject,
@@ -108,32 +127,20 @@ class ExpectationCalculator:
 
         # 安全性
         if safety:
-            risk = safety.get("risk_level", "unknown")
-            if risk == "danger":
-                prob_2x *= 0.3
-                prob_5x *= 0.1
-                prob_10x *= 0.05
-                adjustments.append("危険トークン(---)")
-            elif risk == "warning":
-                prob_2x *= 0.7
-                prob_5x *= 0.5
-                adjustments.append("警告あり(-)")
-            elif risk == "safe":
-                prob_2x *= 1.1
-                adjustments.append("安全確認(+)")
+            adj = self.RISK_ADJUSTMENTS.get(safety.get("risk_level", "unknown"))
+            if adj:
+                (m2, m5, m10), label = adj
+                prob_2x *= m2
+                prob_5x *= m5
+                prob_10x *= m10
+                adjustments.append(label)
 
         # 確率を 0-100 にクランプ
         prob_2x = min(100, max(0, prob_2x))
         prob_5x = min(100, max(0, prob_5x))
         prob_10x = min(100, max(0, prob_10x))
 
-        # 期待値 = Σ(確率 × 倍率) + (1-Σ確率) × 0.5（損失想定）
-        ev = (
-            (prob_2x / 100 * 2)
-            + (prob_5x / 100 * 5)
-            + (prob_10x / 100 * 10)
-            + ((100 - prob_2x) / 100 * 0.5)
-        )
+        ev = self._expected_value(prob_2x, prob_5x, prob_10x)
 
         # リスクリワード判定
         if ev >= 2.0:
@@ -161,7 +168,14 @@ class ExpectationCalculator:
 
     def _base_probabilities(self, mcap: float) -> tuple[float, float, float]:
         """時価総額レンジに基づくベース確率"""
-        for _name, (low, high, p2, p5, p10) in self.MCAP_GROWTH_PROBS.items():
-            if low <= mcap < high:
-                return p2, p5, p10
-        return 5, 1, 0.2
+        return self.MCAP_GROWTH_PROBS[bisect_right(self.MCAP_THRESHOLDS, mcap)]
+
+    @staticmethod
+    def _expected_value(prob_2x: float, prob_5x: float, prob_10x: float) -> float:
+        """期待値 = Σ(確率 × 倍率) + (1-Σ確率) × 0.5（損失想定）"""
+        return (
+            (prob_2x / 100 * 2)
+            + (prob_5x / 100 * 5)
+            + (prob_10x / 100 * 10)
+            + ((100 - prob_2x) / 100 * 0.5)
+        )
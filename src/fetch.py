@@ -0,0 +1,242 @@
+"""
+HTTP 共通ユーティリティ
+
+- セッション生成: 全モジュールで共有するコネクションプール + DNSキャッシュ付きセッション
+  （aiodns があれば非同期リゾルバを使い、getaddrinfo のスレッドプールを経由しない）
+- JSON デコード: orjson があれば使用（C実装・バイト列を直接デコード）、なければ標準 json
+- リトライ: 一時的な失敗（接続エラー / タイムアウト / 429・5xx）を指数バックオフ + ジッターで再試行
+  （Retry-After ヘッダがあればそちらを優先）
+- TTLキャッシュ: 冪等GETの結果をキー単位で一定時間再利用（同時ミスは1回のロードを共有）
+- ホスト単位の同時実行制限: 同じAPIへの並列リクエストが集中しないよう netloc ごとに Semaphore
+- レート制限: 並行する呼び出し側で 1秒あたりのリクエスト数を共有（sleep による逐次化の代替）
+  公開APIはホスト単位のトークンバケットをプロセス全体で共有（host_rate_limit）
+- ヘッジリクエスト: 交換可能なミラーへ同時に投げ、最初に成功した結果を採用
+"""
+import asyncio
+import json
+import logging
+import random
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar
+from urllib.parse import urlencode, urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# orjson はオプション依存
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# aiodns はオプション依存（あれば aiohttp の AsyncResolver で名前解決をノンブロッキングに）
+try:
+    import aiodns  # noqa: F401
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# 再試行する HTTP ステータス
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Retry-After に従う待ち時間の上限（秒）
+MAX_RETRY_AFTER = 30.0
+
+USER_AGENT = "Mozilla/5.0 (compatible; SolScreener/5.8)"
+
+
+def create_session() -> aiohttp.ClientSession:
+    """
+    共有用の ClientSession を生成（実行中のイベントループ内で呼ぶこと）
+    Keep-Alive / DNSキャッシュを効かせるため、プロセス内で1つだけ作って全モジュールに渡す。
+    """
+    connector = aiohttp.TCPConnector(
+        resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None,
+        limit=64,
+        limit_per_host=8,
+        ttl_dns_cache=600,
+        keepalive_timeout=75,  # 監視サイクル内の同一ホストへの再接続（TLS ハンドシェイク）を避ける
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30),
+        headers={"User-Agent": USER_AGENT},
+    )
+
+
+async def read_json(resp: aiohttp.ClientResponse) -> Any:
+    """レスポンスボディをバイト列のままJSONデコード（str への変換を挟まない）"""
+    return json_loads(await resp.read())
+
+
+class TTLCache:
+    """
+    キー単位のTTLキャッシュ（None はキャッシュしない）
+    maxsize を超えたら最も古く取得したエントリから捨てる（常駐プロセスで無限に育てない）
+    同じキーのミスが同時に来たらロードは1回だけ行い、結果を全員で共有する（single-flight）
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self._data: dict[str, tuple[float, Any]] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._maxsize = maxsize
+
+    async def get_or_load(self, key: str, ttl: float,
+                          loader: Callable[[], Awaitable[T]]) -> T:
+        hit = self._data.get(key)
+        if hit and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 待ち手の1人がキャンセルされても共有中のロードは止めない
+        return await asyncio.shield(fut)
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        now = time.monotonic()
+        value = await loader()
+        if value is not None:
+            # 取り直したキーは末尾へ（dict の挿入順 = 取得時刻順を保つ）
+            self._data.pop(key, None)
+            self._data[key] = (now, value)
+            if self._maxsize is not None and len(self._data) > self._maxsize:
+                del self._data[next(iter(self._data))]
+        return value
+
+
+def cache_key(url: str, params: Optional[dict] = None) -> str:
+    """URL + クエリパラメータ（順不同）からキャッシュキーを作る"""
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+class HostLimiter:
+    """ホスト（netloc）単位の同時実行数制限。Semaphore はホストごとに遅延生成"""
+
+    def __init__(self, per_host: int = 4):
+        self._sems: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(per_host)
+        )
+
+    def __call__(self, url: str) -> asyncio.Semaphore:
+        return self._sems[urlsplit(url).netloc]
+
+
+class RateLimiter:
+    """
+    一定レートでリクエストを発行させるリミッタ（async with で使用）
+
+    取得ごとに次の発行時刻を予約するので、並行する呼び出し側が同じ予算を共有し、
+    待つのは予算を超えた分だけ（他の await とは重ねられる）。
+    burst > 1 なら、しばらく空いていた後は burst 件まで待たずに発行できる（トークンバケット）。
+    """
+
+    def __init__(self, rate: float, period: float = 1.0, burst: int = 1):
+        self._interval = period / rate
+        self._burst_window = (burst - 1) * self._interval
+        self._next = 0.0
+
+    async def __aenter__(self):
+        now = time.monotonic()
+        start = max(now, self._next)
+        self._next = start + self._interval
+        wait = start - self._burst_window - now
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+# ホストごとの公開レート制限 (1秒あたり件数, バースト)。ここに無いホストは制限しない
+HOST_RATE_LIMITS: dict[str, tuple[float, int]] = {
+    "api.dexscreener.com": (5.0, 20),         # 300 req/min
+    "api-mainnet.magiceden.dev": (2.0, 10),   # 120 req/min
+}
+
+_host_rate_limiters: dict[str, RateLimiter] = {}
+
+
+def host_rate_limit(url: str):
+    """
+    URL のホストに対応する共有 RateLimiter を返す（async with で使用）
+    複数モニタが同じ API を叩いても、プロセス全体で1つの予算を共有する。
+    """
+    host = urlsplit(url).netloc
+    limiter = _host_rate_limiters.get(host)
+    if limiter is None:
+        limit = HOST_RATE_LIMITS.get(host)
+        if limit is None:
+            return nullcontext()
+        limiter = _host_rate_limiters[host] = RateLimiter(limit[0], burst=limit[1])
+    return limiter
+
+
+def _retry_after(e: aiohttp.ClientResponseError) -> Optional[float]:
+    """Retry-After（秒数形式のみ）を読む。無い / 日付形式なら None"""
+    value = e.headers.get("Retry-After") if e.headers else None
+    try:
+        return min(float(value), MAX_RETRY_AFTER) if value else None
+    except ValueError:
+        return None
+
+
+def raise_for_retry(resp: aiohttp.ClientResponse):
+    """再試行対象のステータスなら例外化（404 等はそのまま呼び出し側で処理）"""
+    if resp.status in RETRY_STATUSES:
+        resp.raise_for_status()
+
+
+async def with_retry(
+    coro_factory: Callable[[], Awaitable[T]],
+    attempts: int = 3,
+    base: float = 0.5,
+) -> T:
+    """
+    coro_factory() を一時的な失敗のみ再試行して実行
+    待ち時間: base * 2^i + jitter(0〜0.2秒)、Retry-After があればそれ以上。
+    最終試行の例外はそのまま送出。
+    """
+    for i in range(attempts):
+        delay = base * (2 ** i) + random.random() * 0.2
+        try:
+            return await coro_factory()
+        except aiohttp.ClientResponseError as e:
+            if e.status not in RETRY_STATUSES or i == attempts - 1:
+                raise
+            delay = max(delay, _retry_after(e) or 0.0)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if i == attempts - 1:
+                raise
+        await asyncio.sleep(delay)
+    raise RuntimeError("unreachable")
+
+
+async def first_successful(coros: Iterable[Awaitable[Optional[T]]]) -> Optional[T]:
+    """
+    複数のコルーチンを同時に実行し、最初に truthy な結果を返したものを採用
+    残りはキャンセル。全て失敗（例外 / 空）なら None。
+    """
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            try:
+                result = await fut
+            except Exception:
+                continue
+            if result:
+                return result
+        return None
+    finally:
+        for t in tasks:
+            t.cancel()
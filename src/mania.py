@@ -9,14 +9,20 @@
 """
 import asyncio
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Optional
 
 import aiohttp
 
-from .config import config
+from .config import config, parse_labeled_list
+from .fetch import RateLimiter, TTLCache, read_json
 
 logger = logging.getLogger(__name__)
 
+HOLDERS_TIMEOUT = aiohttp.ClientTimeout(total=15)
+HELIUS_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
 # ── 既知のスマートマネーウォレット（公開情報ベース） ──
 # ラベル付きで管理。環境変数 WATCH_WALLETS で追加可能。
 KNOWN_SMART_WALLETS: dict[str, str] = {
@@ -25,35 +31,42 @@ KNOWN_SMART_WALLETS: dict[str, str] = {
 }
 
 
+# Helius enhanced transactions でトレードとみなす type
+TRADE_TX_TYPES = frozenset({"SWAP", "TOKEN_MINT"})
+
+
+def _load_smart_wallets() -> Mapping[str, str]:
+    """環境変数 + 既知ウォレットをマージ"""
+    wallets = dict(KNOWN_SMART_WALLETS)
+    wallets.update(parse_labeled_list(config.watch_wallets, "Custom"))
+    return MappingProxyType(wallets)
+
+
+# config は起動時に確定するので import 時に1回だけ解析（読み取り専用で全インスタンス共有）
+SMART_WALLETS = _load_smart_wallets()
+
+
 class ManiaScorer:
     """スマートマネー追跡 & 高度なスコアリング"""
 
     RUGCHECK_API = "https://api.rugcheck.xyz/v1"
+    HELIUS_TXNS_URL = "https://api.helius.xyz/v0/addresses/{}/transactions"
+    # スキャン間隔内に同じトークン/ウォレットを再分析しても API を叩き直さない
+    CACHE_TTL = 300
+    CACHE_MAXSIZE = 1024
+    # API ごとの発行レート（件/秒）。並行チェック全体で共有する
+    RUGCHECK_RATE = 5
+    HELIUS_RATE = 3
 
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
-        self.smart_wallets = self._load_smart_wallets()
-        self.rpc_url = self._get_rpc_url()
-
-    def _load_smart_wallets(self) -> dict[str, str]:
-        """環境変数 + 既知ウォレットをマージ"""
-        wallets = dict(KNOWN_SMART_WALLETS)
-        raw = config.watch_wallets
-        if raw:
-            for entry in raw.split(","):
-                entry = entry.strip()
-                if ":" in entry:
-                    addr, label = entry.split(":", 1)
-                    wallets[addr.strip()] = label.strip()
-                elif entry:
-                    wallets[entry] = "Custom"
-        return wallets
-
-    def _get_rpc_url(self) -> str:
-        helius_key = getattr(config, "helius_api_key", "")
-        if helius_key:
-            return f"https://mainnet.helius-rpc.com/?api-key={helius_key}"
-        return "https://api.mainnet-beta.solana.com"
+        self._holders_cache = TTLCache(maxsize=self.CACHE_MAXSIZE)  # token -> topHolders
+        self._wallet_txns_cache = TTLCache(maxsize=self.CACHE_MAXSIZE)  # wallet -> 直近取引
+        self._rugcheck_limit = RateLimiter(self.RUGCHECK_RATE)
+        self._helius_limit = RateLimiter(self.HELIUS_RATE)
+        self.smart_wallets = SMART_WALLETS
+        self._smart_wallet_set = frozenset(SMART_WALLETS)  # 内側ループの所属判定用
+        self.rpc_url = config.rpc_url
 
     # ================================================================
     # メイン: スマートマネーチェック
@@ -85,52 +98,57 @@ class ManiaScorer:
             result["details"] = "ホルダー情報取得不可"
             return result
 
-        # ── ホエール分析 ──
+        # ── ホエール / 既知スマートマネー / インサイダーを 1 パスで集計 ──
         whale_threshold = 2.0  # 2% 以上保有 = ホエール
-        whales = [h for h in top_holders if h.get("pct", 0) >= whale_threshold]
-        result["whale_count"] = len(whales)
-
-        # ── 既知スマートマネーとの照合 ──
+        get = dict.get
+        smart_wallets = self.smart_wallets
+        smart_wallet_set = self._smart_wallet_set
+        whale_addrs: list[str] = []
+        total_whale_pct = 0.0
+        insider_count = 0
         notable: list[dict] = []
         sm_score = 0
 
-        for holder in top_holders[:20]:
-            addr = holder.get("address", "")
-            pct = holder.get("pct", 0)
-            is_insider = holder.get("isInsider", False)
-
-            if addr in self.smart_wallets:
-                label = self.smart_wallets[addr]
+        for i, holder in enumerate(top_holders):
+            addr = get(holder, "address", "")
+            pct = get(holder, "pct", 0)
+            is_insider = get(holder, "isInsider", False)
+
+            if pct >= whale_threshold:
+                whale_addrs.append(addr)
+                total_whale_pct += pct
+            if i < 10 and is_insider:
+                insider_count += 1
+            if i < 20 and addr in smart_wallet_set:
                 notable.append({
                     "address": addr,
-                    "label": label,
+                    "label": smart_wallets[addr],
                     "pct": round(pct, 2),
                     "pnl": 0,  # PnL は Helius API で後から取得可能
                     "is_insider": is_insider,
                 })
                 sm_score += 20  # 既知ウォレット1つにつき +20
 
-        # ── ホエール保有パターン分析 ──
-        total_whale_pct = sum(h.get("pct", 0) for h in whales)
+        whale_count = len(whale_addrs)
+        result["whale_count"] = whale_count
         result["holder_concentration"] = round(total_whale_pct, 1)
 
         # ホエールが多いが分散している → ポジティブ
-        if len(whales) >= 3 and total_whale_pct < 30:
+        if whale_count >= 3 and total_whale_pct < 30:
             sm_score += 15  # 複数のホエールが分散保有
-        elif len(whales) >= 2 and total_whale_pct < 20:
+        elif whale_count >= 2 and total_whale_pct < 20:
             sm_score += 10
 
         # インサイダーが少ない → ポジティブ
-        insider_count = sum(1 for h in top_holders[:10] if h.get("isInsider"))
         if insider_count == 0:
             sm_score += 10
         elif insider_count <= 2:
             sm_score += 5
 
         # ── Helius API でウォレット履歴分析（オプション） ──
-        if config.helius_api_key and whales:
+        if config.helius_api_key and whale_addrs:
             helius_bonus = await self._analyze_whale_history(
-                [w.get("address", "") for w in whales[:5]],
+                whale_addrs[:5],
                 token_address,
             )
             sm_score += helius_bonus
@@ -142,7 +160,7 @@ class ManiaScorer:
         details = []
         if notable:
             details.append(f"既知SM: {len(notable)}件")
-        details.append(f"ホエール: {len(whales)}件 ({total_whale_pct:.1f}%)")
+        details.append(f"ホエール: {whale_count}件 ({total_whale_pct:.1f}%)")
         details.append(f"インサイダー: {insider_count}件")
         result["details"] = " | ".join(details)
 
@@ -153,19 +171,26 @@ class ManiaScorer:
     # RugCheck topHolders 取得
     # ================================================================
     async def _get_top_holders(self, token_address: str) -> list[dict]:
-        """RugCheck API から上位ホルダーを取得"""
+        """RugCheck API から上位ホルダーを取得（TTLキャッシュ、失敗時は空リストでキャッシュしない）"""
+        holders = await self._holders_cache.get_or_load(
+            token_address, self.CACHE_TTL,
+            lambda: self._fetch_top_holders(token_address),
+        )
+        return holders if holders is not None else []
+
+    async def _fetch_top_holders(self, token_address: str) -> Optional[list[dict]]:
         try:
             url = f"{self.RUGCHECK_API}/tokens/{token_address}/report/summary"
-            async with self.session.get(
-                url, timeout=aiohttp.ClientTimeout(total=15)
+            async with self._rugcheck_limit, self.session.get(
+                url, timeout=HOLDERS_TIMEOUT
             ) as resp:
                 if resp.status != 200:
-                    return []
-                data = await resp.json()
+                    return None
+                data = await read_json(resp)
                 return data.get("topHolders", [])
         except Exception as e:
             logger.debug(f"RugCheck topHolders error: {e}")
-            return []
+            return None
 
     # ================================================================
     # Helius API: ウォレット取引履歴分析
@@ -185,52 +210,61 @@ class ManiaScorer:
 
         for addr in wallet_addresses[:3]:
             try:
-                url = f"https://api.helius.xyz/v0/addresses/{addr}/transactions"
-                params = {"api-key": config.helius_api_key, "limit": 20}
-                async with self.session.get(
-                    url, params=params,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status != 200:
-                        continue
-                    txns = await resp.json()
-
-                # トークン関連の取引があるか
-                token_related = sum(
-                    1 for tx in txns
-                    if token_address in str(tx.get("tokenTransfers", []))
+                txns = await self._wallet_txns_cache.get_or_load(
+                    addr, self.CACHE_TTL, lambda: self._fetch_wallet_txns(addr),
                 )
-
-                if token_related > 0:
+                if txns is None:
+                    continue
+
+                # トークン関連の取引有無 + 過去の成功トレード数（簡易判定）を1パスで集計
+                token_related = False
+                swap_count = 0
+                for tx in txns:
+                    if tx.get("type") in TRADE_TX_TYPES:
+                        swap_count += 1
+                    if not token_related:
+                        token_related = any(
+                            tt.get("mint") == token_address
+                            for tt in tx.get("tokenTransfers") or ()
+                        )
+
+                if token_related:
                     bonus += 5  # このウォレットがこのトークンを取引中
 
-                # 過去の成功トレード数（簡易判定）
-                swap_count = sum(
-                    1 for tx in txns
-                    if tx.get("type") in ("SWAP", "TOKEN_MINT")
-                )
                 if swap_count >= 10:
                     bonus += 3  # アクティブトレーダー
 
             except Exception as e:
                 logger.debug(f"Helius wallet analysis error: {e}")
 
-            await asyncio.sleep(0.3)
-
         return min(bonus, 20)  # 最大 +20
 
+    async def _fetch_wallet_txns(self, addr: str) -> Optional[list[dict]]:
+        """Helius からウォレットの直近取引を取得（200以外は None。HELIUS_RATE でレート制限）"""
+        url = self.HELIUS_TXNS_URL.format(addr)
+        params = {"api-key": config.helius_api_key, "limit": 20}
+        async with self._helius_limit, self.session.get(
+            url, params=params,
+            timeout=HELIUS_TIMEOUT,
+        ) as resp:
+            if resp.status != 200:
+                return None
+            return await read_json(resp)
+
     # ================================================================
     # 一括チェック
     # ================================================================
     async def check_multiple(self, token_addresses: list[str]) -> dict[str, dict]:
-        """複数トークンのスマートマネーを一括チェック"""
-        results = {}
-        for addr in token_addresses:
-            try:
-                result = await self.check_smart_money(addr)
-                results[addr] = result
-            except Exception as e:
-                logger.warning(f"SM check failed for {addr}: {e}")
-                results[addr] = {"smart_money_score": 0, "whale_count": 0}
-            await asyncio.sleep(0.5)
-        return results
+        """複数トークンのスマートマネーを一括チェック（同時3件、API ごとのレートは RateLimiter で制御）"""
+        sem = asyncio.Semaphore(3)
+
+        async def _safe_check(addr: str) -> tuple[str, dict]:
+            async with sem:
+                try:
+                    result = await self.check_smart_money(addr)
+                except Exception as e:
+                    logger.warning(f"SM check failed for {addr}: {e}")
+                    result = {"smart_money_score": 0, "whale_count": 0}
+                return addr, result
+
+        return dict(await asyncio.gather(*(_safe_check(a) for a in token_addresses)))
@@ -9,20 +9,43 @@
 import asyncio
 import logging
 import math
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, field
 from typing import Optional
 
 import aiohttp
 
+from .config import config, parse_list
+from .fetch import host_rate_limit, read_json
+from .scanner import fetch_token_pairs
+from .state import BoundedSet
+
 logger = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# 監視コレクションは起動時に確定するので import 時に1回だけ解析
+WATCH_NFTS: tuple[str, ...] = parse_list(config.watch_nfts)
+
+
+def _num(d: Optional[dict], *path: str) -> float:
+    """ネストした dict から数値を取り出す（途中欠損 / None / 変換不能なら 0.0、空 dict を作らない）"""
+    for key in path:
+        if not isinstance(d, dict):
+            return 0.0
+        d = d.get(key)
+    try:
+        return float(d or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
 
 # ============================================================
 # 1. TGE（Token Generation Event）監視
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class TGEEvent:
     """TGEイベント"""
     name: str
@@ -39,88 +62,70 @@ class TGEMonitor:
     """新規トークンローンチイベントを監視"""
 
     DEXSCREENER_API = "https://api.dexscreener.com"
+    SEEN_MAXSIZE = 1000  # 既出トークンを覚えておく件数（古い順に忘れる）
 
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
-        self.seen_tokens: set = set()
+        self.seen_tokens = BoundedSet(self.SEEN_MAXSIZE)
 
     async def check_new_launches(self, max_age_minutes: int = 30) -> list[TGEEvent]:
         """直近N分以内の新規トークンローンチを検出"""
-        events = []
-
-        # DexScreener最新プロフィール
-        try:
-            url = f"{self.DEXSCREENER_API}/token-profiles/latest/v1"
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    for item in (data if isinstance(data, list) else []):
-                        if item.get("chainId") != "solana":
-                            continue
-                        addr = item.get("tokenAddress", "")
-                        if addr in self.seen_tokens:
-                            continue
-                        self.seen_tokens.add(addr)
-                        events.append(TGEEvent(
-                            name=item.get("description", "New Token"),
-                            token_address=addr,
-                            platform="dexscreener",
-                            source="dexscreener_profiles",
-                        ))
-        except Exception as e:
-            logger.debug(f"TGE DexScreener error: {e}")
-
-        # DexScreenerブーストされた新規
-        try:
-            url = f"{self.DEXSCREENER_API}/token-boosts/latest/v1"
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    for item in (data if isinstance(data, list) else []):
-                        if item.get("chainId") != "solana":
-                            continue
-                        addr = item.get("tokenAddress", "")
-                        if addr in self.seen_tokens:
-                            continue
-                        self.seen_tokens.add(addr)
-                        events.append(TGEEvent(
-                            name=f"Boosted: {addr[:8]}...",
-                            token_address=addr,
-                            platform="dexscreener",
-                            source="dexscreener_boosts",
-                        ))
-        except Exception as e:
-            logger.debug(f"TGE boosts error: {e}")
+        # 最新プロフィール / ブーストは独立なので同時に取得
+        profiles, boosts = await asyncio.gather(
+            self._fetch_solana_items("token-profiles/latest/v1"),
+            self._fetch_solana_items("token-boosts/latest/v1"),
+        )
 
-        # 各TGEの詳細を取得
-        for event in events:
-            await self._enrich_tge(event)
-            await asyncio.sleep(0.2)
-
-        # 古いseen_tokensをクリーンアップ
-        if len(self.seen_tokens) > 1000:
-            self.seen_tokens = set(list(self.seen_tokens)[-500:])
+        # 両方に出るトークンはプロフィール側を優先し、1パスで重複排除
+        events = []
+        for items, source in ((profiles, "dexscreener_profiles"), (boosts, "dexscreener_boosts")):
+            for item in items:
+                addr = item.get("tokenAddress", "")
+                if addr in self.seen_tokens:
+                    continue
+                self.seen_tokens.add(addr)
+                events.append(TGEEvent(
+                    name=(
+                        item.get("description", "New Token")
+                        if source == "dexscreener_profiles"
+                        else f"Boosted: {addr[:8]}..."
+                    ),
+                    token_address=addr,
+                    platform="dexscreener",
+                    source=source,
+                ))
+
+        # 各TGEの詳細をまとめて取得（最大30件ずつ1リクエスト）
+        if events:
+            pairs = await fetch_token_pairs(self.session, [e.token_address for e in events])
+            for event in events:
+                pair = pairs.get(event.token_address)
+                if pair:
+                    self._enrich_tge(event, pair)
 
         if events:
             logger.info(f"TGE: {len(events)}件の新規ローンチ検出")
 
         return events
 
-    async def _enrich_tge(self, event: TGEEvent):
-        """TGEイベントの詳細を取得"""
-        if not event.token_address:
-            return
+    async def _fetch_solana_items(self, path: str) -> list[dict]:
+        """DexScreener の一覧エンドポイントから Solana の項目だけ取得（失敗時は空）"""
         try:
-            url = f"https://api.dexscreener.com/tokens/v1/solana/{event.token_address}"
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            url = f"{self.DEXSCREENER_API}/{path}"
+            async with host_rate_limit(url), self.session.get(url, timeout=REQUEST_TIMEOUT) as resp:
                 if resp.status != 200:
-                    return
-                data = await resp.json()
-
-            if not data or not isinstance(data, list):
-                return
+                    return []
+                data = await read_json(resp)
+            if not isinstance(data, list):
+                return []
+            return [item for item in data if item.get("chainId") == "solana"]
+        except Exception as e:
+            logger.debug(f"TGE DexScreener error ({path}): {e}")
+            return []
 
-            pair = data[0]
+    def _enrich_tge(self, event: TGEEvent, pair: dict):
+        """DexScreener のペア情報で TGE イベントの詳細を埋める"""
+        try:
             event.name = pair.get("baseToken", {}).get("name", event.name)
             event.symbol = pair.get("baseToken", {}).get("symbol", "")
             event.initial_mcap = float(pair.get("marketCap", 0) or 0)
@@ -135,7 +140,7 @@ class TGEMonitor:
 # 2. NFTフロア価格監視
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class NFTFloorAlert:
     """NFTフロアアラート"""
     collection: str
@@ -151,52 +156,60 @@ class NFTFloorMonitor:
     """NFTコレクションのフロア価格変動を監視"""
 
     MAGIC_EDEN_API = "https://api-mainnet.magiceden.dev/v2"
+    CONCURRENCY = 2  # Magic Eden 公開APIは 429 が出やすいので控えめ
 
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
-        self.watch_nfts = self._load_nfts()
+        self.watch_nfts = WATCH_NFTS
         self.prev_floors: dict[str, float] = {}
-
-    def _load_nfts(self) -> list[str]:
-        import os
-        raw = os.getenv("WATCH_NFTS", "")
-        return [n.strip() for n in raw.split(",") if n.strip()]
+        # url -> ETag（304 = 前回 200 から変化なし → 前回と同じ判定結果なので通知なし）
+        self._etags: dict[str, str] = {}
 
     async def check_all(self) -> list[NFTFloorAlert]:
-        alerts = []
-        for symbol in self.watch_nfts:
-            try:
-                alert = await self._check_collection(symbol)
-                if alert:
-                    alerts.append(alert)
-            except Exception as e:
-                logger.debug(f"NFT floor error {symbol}: {e}")
-            await asyncio.sleep(0.3)
-        return alerts
+        sem = asyncio.Semaphore(self.CONCURRENCY)
+
+        async def _safe_check(symbol: str) -> Optional[NFTFloorAlert]:
+            async with sem:
+                try:
+                    return await self._check_collection(symbol)
+                except Exception as e:
+                    logger.debug(f"NFT floor error {symbol}: {e}")
+                    return None
+
+        results = await asyncio.gather(*(_safe_check(s) for s in self.watch_nfts))
+        return [alert for alert in results if alert]
 
     async def _check_collection(self, symbol: str) -> Optional[NFTFloorAlert]:
         try:
             url = f"{self.MAGIC_EDEN_API}/collections/{symbol}/stats"
-            async with self.session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10),
-                headers={"User-Agent": "SolScreener/4.0"},
+            etag = self._etags.get(url)
+            async with host_rate_limit(url), self.session.get(
+                url, timeout=REQUEST_TIMEOUT,
+                headers={"If-None-Match": etag} if etag else None,
             ) as resp:
                 if resp.status != 200:
-                    return None
-                data = await resp.json()
+                    return None  # 304 = フロア変化なし
+                data = await read_json(resp)
+                etag = resp.headers.get("ETag")
 
             floor = (data.get("floorPrice", 0) or 0) / 1e9
             volume = (data.get("volumeAll", 0) or 0) / 1e9
 
-            prev = self.prev_floors.get(symbol)
-            self.prev_floors[symbol] = floor
+            if etag:
+                self._etags[url] = etag
 
-            if prev is None or prev == 0 or floor == 0:
+            # 基準値は初回と通知時だけ更新（閾値未満の揺れで基準をずらさず、緩やかな変化も検知）
+            prev = self.prev_floors.get(symbol)
+            if prev is None or prev == 0:
+                self.prev_floors[symbol] = floor
+                return None
+            if floor == 0:
                 return None
 
             change_pct = ((floor - prev) / prev) * 100
 
             if abs(change_pct) >= 15:
+                self.prev_floors[symbol] = floor
                 return NFTFloorAlert(
                     collection=symbol, symbol=symbol,
                     prev_floor=prev, current_floor=floor,
@@ -213,7 +226,7 @@ class NFTFloorMonitor:
 # 3. Memeチャート監視（急騰検知）— vol_surge バグ修正済み
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class MemeAlert:
     """Meme急騰アラート"""
     token_address: str
@@ -238,10 +251,11 @@ class MemeChartMonitor:
         "1h_pump": 50,
         "volume_surge": 300,
     }
+    PREV_VOLUMES_MAXSIZE = 500  # 出来高を覚えておくトークン数（最も長く見ていないものから忘れる）
 
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
-        self.prev_volumes: dict[str, float] = {}
+        self.prev_volumes: OrderedDict[str, float] = OrderedDict()
 
     async def scan_hot_memes(self, min_liquidity: float = 5000) -> list[MemeAlert]:
         """急騰中のMemeトークンをスキャン"""
@@ -249,61 +263,68 @@ class MemeChartMonitor:
 
         try:
             url = f"{self.DEXSCREENER_API}/latest/dex/search?q=solana"
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            async with host_rate_limit(url), self.session.get(url, timeout=REQUEST_TIMEOUT) as resp:
                 if resp.status != 200:
                     return alerts
-                data = await resp.json()
+                data = await read_json(resp)
 
-            pairs = data.get("pairs", [])
+            # 数値の取り出し前に Solana 以外のペアを落とす
+            pairs = [p for p in data.get("pairs") or () if p.get("chainId") == "solana"]
 
-            for pair in pairs:
-                if pair.get("chainId") != "solana":
-                    continue
+            # ループ不変の閾値・辞書はローカルに束縛
+            pump_5m = self.THRESHOLDS["5m_pump"]
+            pump_1h = self.THRESHOLDS["1h_pump"]
+            surge_pct = self.THRESHOLDS["volume_surge"]
+            prev_volumes = self.prev_volumes
 
-                liquidity = float(pair.get("liquidity", {}).get("usd", 0) or 0)
+            for pair in pairs:
+                liquidity = _num(pair, "liquidity", "usd")
                 if liquidity < min_liquidity:
                     continue
 
-                price_5m = float(pair.get("priceChange", {}).get("m5", 0) or 0)
-                price_1h = float(pair.get("priceChange", {}).get("h1", 0) or 0)
-                price_24h = float(pair.get("priceChange", {}).get("h24", 0) or 0)
-                volume_24h = float(pair.get("volume", {}).get("h24", 0) or 0)
+                price_change = pair.get("priceChange")
+                price_5m = _num(price_change, "m5")
+                price_1h = _num(price_change, "h1")
+                price_24h = _num(price_change, "h24")
+                volume_24h = _num(pair, "volume", "h24")
 
-                token_addr = pair.get("baseToken", {}).get("address", "")
-                symbol = pair.get("baseToken", {}).get("symbol", "???")
-                name = pair.get("baseToken", {}).get("name", "")
-                pair_addr = pair.get("pairAddress", "")
+                base = pair.get("baseToken") or {}
+                token_addr = base.get("address", "")
 
                 alert_type = None
 
-                if price_5m >= self.THRESHOLDS["5m_pump"]:
+                if price_5m >= pump_5m:
                     alert_type = "5m_pump"
-                elif price_1h >= self.THRESHOLDS["1h_pump"]:
+                elif price_1h >= pump_1h:
                     alert_type = "1h_pump"
 
                 # 出来高急増 — vol_surge を事前に初期化（バグ修正）
                 vol_surge = 0.0
-                prev_vol = self.prev_volumes.get(token_addr, 0)
+                prev_vol = prev_volumes.get(token_addr, 0)
                 if prev_vol > 0 and volume_24h > 0:
                     vol_surge = (volume_24h / prev_vol - 1) * 100
-                    if vol_surge >= self.THRESHOLDS["volume_surge"]:
+                    if vol_surge >= surge_pct:
                         alert_type = alert_type or "volume_surge"
-                self.prev_volumes[token_addr] = volume_24h
+                prev_volumes[token_addr] = volume_24h
+                prev_volumes.move_to_end(token_addr)
 
+                # 表示用フィールドはアラートになるペアだけ取り出す
                 if alert_type:
                     alerts.append(MemeAlert(
-                        token_address=token_addr, symbol=symbol, name=name,
+                        token_address=token_addr,
+                        symbol=base.get("symbol", "???"),
+                        name=base.get("name", ""),
                         price_change_5m=price_5m, price_change_1h=price_1h,
                         price_change_24h=price_24h,
                         volume_surge=vol_surge,
                         liquidity_usd=liquidity,
-                        alert_type=alert_type, pair_address=pair_addr,
+                        alert_type=alert_type,
+                        pair_address=pair.get("pairAddress", ""),
                     ))
 
-            # 古いvolume記録をクリーンアップ
-            if len(self.prev_volumes) > 500:
-                recent = dict(list(self.prev_volumes.items())[-250:])
-                self.prev_volumes = recent
+            # 古いvolume記録をクリーンアップ（LRU）
+            while len(prev_volumes) > self.PREV_VOLUMES_MAXSIZE:
+                prev_volumes.popitem(last=False)
 
         except Exception as e:
             logger.debug(f"Meme chart scan error: {e}")
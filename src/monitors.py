@@ -5,99 +5,153 @@
 """
 import asyncio
 import logging
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Optional
 
 import aiohttp
 
-from .config import config
+from .config import config, parse_labeled_list, parse_list
+from .fetch import TTLCache, host_rate_limit, read_json
+from .scanner import fetch_token_pairs
 
 logger = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# 監視対象は起動時に確定するので import 時に1回だけ解析（読み取り専用で全インスタンス共有）
+WATCH_WALLETS: Mapping[str, str] = MappingProxyType(
+    parse_labeled_list(config.watch_wallets, "Unknown")
+)
+WATCH_TOKENS: tuple[str, ...] = parse_list(config.watch_tokens)
+
+SOL_PAIR_URL = "https://api.dexscreener.com/latest/dex/pairs/solana/So11111111111111111111111111111111111111112"
+SOL_COINGECKO_URL = "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd"
+SOL_PRICE_TTL = 10  # 秒。この間の呼び出しは通信せずキャッシュを返す
+
+_sol_price_cache = TTLCache(maxsize=1)
+
+
+async def get_sol_price(session: aiohttp.ClientSession) -> Optional[float]:
+    """
+    SOL/USD 価格（DexScreener → CoinGecko フォールバック、取得不可なら None）
+    SOL_PRICE_TTL 秒キャッシュし、同時の呼び出しは1回の取得を共有する。
+    """
+    return await _sol_price_cache.get_or_load(
+        "SOL", SOL_PRICE_TTL, lambda: _fetch_sol_price(session),
+    )
+
+
+async def _fetch_sol_price(session: aiohttp.ClientSession) -> Optional[float]:
+    try:
+        async with host_rate_limit(SOL_PAIR_URL), session.get(SOL_PAIR_URL, timeout=REQUEST_TIMEOUT) as resp:
+            if resp.status == 200:
+                data = await read_json(resp)
+                pair = data.get("pair") or (data.get("pairs") or [{}])[0]
+                price = float(pair.get("priceUsd", 0) or 0)
+                if price > 0:
+                    return price
+    except Exception:
+        pass
+
+    # フォールバック: CoinGecko
+    try:
+        async with session.get(SOL_COINGECKO_URL, timeout=REQUEST_TIMEOUT) as resp:
+            if resp.status != 200:
+                return None
+            data = await read_json(resp)
+        price = float(data.get("solana", {}).get("usd", 0) or 0)
+        return price if price > 0 else None
+    except Exception:
+        return None
+
 
 class WalletMonitor:
     """ウォレットの動きを監視（Copy Trading 参考用）"""
 
+    RPC_BATCH_SIZE = 100  # 1回の JSON-RPC バッチに詰めるウォレット数
+
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
-        self.wallets = self._load_wallets()
-        self.rpc_url = self._get_rpc_url()
+        self.wallets = WATCH_WALLETS
+        self.rpc_url = config.rpc_url
         self.last_signatures: dict[str, str] = {}
 
-    def _load_wallets(self) -> dict[str, str]:
-        raw = config.watch_wallets
-        wallets = {}
-        if raw:
-            for entry in raw.split(","):
-                entry = entry.strip()
-                if ":" in entry:
-                    addr, label = entry.split(":", 1)
-                    wallets[addr.strip()] = label.strip()
-                elif entry:
-                    wallets[entry] = "Unknown"
-        return wallets
-
-    def _get_rpc_url(self) -> str:
-        helius_key = getattr(config, "helius_api_key", "")
-        if helius_key:
-            return f"https://mainnet.helius-rpc.com/?api-key={helius_key}"
-        return "https://api.mainnet-beta.solana.com"
-
     async def check_all(self) -> list[dict]:
-        """全監視ウォレットの新規トランザクションを確認"""
+        """全監視ウォレットの新規トランザクションを確認（JSON-RPC バッチでまとめて問い合わせ）"""
+        items = list(self.wallets.items())
+        batches = [
+            items[i:i + self.RPC_BATCH_SIZE]
+            for i in range(0, len(items), self.RPC_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(self._check_batch(b) for b in batches))
+        return [alert for alerts in results for alert in alerts]
+
+    async def _check_batch(self, wallets: list[tuple[str, str]]) -> list[dict]:
+        """getSignaturesForAddress を1リクエストのバッチで投げ、id でウォレットに戻す"""
+        try:
+            payload = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "getSignaturesForAddress",
+                    "params": [address, {"limit": 5}],
+                }
+                for i, (address, _) in enumerate(wallets)
+            ]
+            async with self.session.post(
+                self.rpc_url, json=payload,
+                timeout=REQUEST_TIMEOUT,
+            ) as resp:
+                if resp.status != 200:
+                    return []
+                data = await read_json(resp)
+        except Exception as e:
+            logger.debug(f"Wallet batch error: {e}")
+            return []
+
+        if not isinstance(data, list):
+            logger.debug(f"Wallet batch error: {data}")
+            return []
+
+        # バッチ応答の順序は保証されないので id で引き当てる
+        by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
         alerts = []
-        for addr, label in self.wallets.items():
+        for i, (address, label) in enumerate(wallets):
+            item = by_id.get(i)
+            if not item:
+                continue
             try:
-                new_txs = await self._check_wallet(addr, label)
-                alerts.extend(new_txs)
+                alerts.extend(self._diff_signatures(address, label, item.get("result") or []))
             except Exception as e:
                 logger.debug(f"Wallet monitor error {label}: {e}")
-            await asyncio.sleep(0.3)
         return alerts
 
-    async def _check_wallet(self, address: str, label: str) -> list[dict]:
-        """1ウォレットの新規トランザクションを確認"""
+    def _diff_signatures(self, address: str, label: str, sigs: list[dict]) -> list[dict]:
+        """前回の最新署名より新しい（成功した）トランザクションをアラート化"""
         alerts = []
-        try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getSignaturesForAddress",
-                "params": [address, {"limit": 5}],
-            }
-            async with self.session.post(
-                self.rpc_url, json=payload,
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status != 200:
-                    return alerts
-                data = await resp.json()
-
-            sigs = data.get("result", [])
-            if not sigs:
-                return alerts
-
-            last_known = self.last_signatures.get(address)
-            self.last_signatures[address] = sigs[0].get("signature", "")
-
-            if last_known is None:
-                return alerts  # 初回は記録のみ
-
-            for sig_info in sigs:
-                sig = sig_info.get("signature", "")
-                if sig == last_known:
-                    break
-                if not sig_info.get("err"):
-                    alerts.append({
-                        "type": "wallet_activity",
-                        "wallet": address,
-                        "label": label,
-                        "signature": sig,
-                        "block_time": sig_info.get("blockTime", 0),
-                    })
-
-        except Exception as e:
-            logger.debug(f"Wallet check error: {e}")
+        if not sigs:
+            return alerts
+
+        last_known = self.last_signatures.get(address)
+        self.last_signatures[address] = sigs[0].get("signature", "")
+
+        if last_known is None:
+            return alerts  # 初回は記録のみ
+
+        for sig_info in sigs:
+            sig = sig_info.get("signature", "")
+            if sig == last_known:
+                break
+            if not sig_info.get("err"):
+                alerts.append({
+                    "type": "wallet_activity",
+                    "wallet": address,
+                    "label": label,
+                    "signature": sig,
+                    "block_time": sig_info.get("blockTime", 0),
+                })
 
         return alerts
 
@@ -105,58 +159,41 @@ class WalletMonitor:
 class LiquidityMonitor:
     """トークンの流動性変動を監視"""
 
-    DEXSCREENER_API = "https://api.dexscreener.com"
 
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
-        self.tokens = self._load_tokens()
+        self.tokens = WATCH_TOKENS
         self.prev_liquidity: dict[str, float] = {}
 
-    def _load_tokens(self) -> list[str]:
-        raw = config.watch_tokens
-        return [t.strip() for t in raw.split(",") if t.strip()] if raw else []
-
     async def check_all(self) -> list[dict]:
-        """全監視トークンの流動性を確認"""
+        """全監視トークンの流動性を確認（DexScreener へは最大30件ずつまとめて問い合わせ）"""
+        pairs = await fetch_token_pairs(self.session, self.tokens)
         alerts = []
         for addr in self.tokens:
-            try:
-                alert = await self._check_token(addr)
+            pair = pairs.get(addr)
+            if pair:
+                alert = self._check_token(addr, pair)
                 if alert:
                     alerts.append(alert)
-            except Exception as e:
-                logger.debug(f"Liquidity monitor error: {e}")
-            await asyncio.sleep(0.3)
         return alerts
 
-    async def _check_token(self, token_address: str) -> Optional[dict]:
+    def _check_token(self, token_address: str, pair: dict) -> Optional[dict]:
         """1トークンの流動性変動を確認"""
         try:
-            url = f"{self.DEXSCREENER_API}/tokens/v1/solana/{token_address}"
-            async with self.session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json()
-
-            if not data or not isinstance(data, list):
-                return None
-
-            pair = data[0]
             current_liq = float(pair.get("liquidity", {}).get("usd", 0) or 0)
             symbol = pair.get("baseToken", {}).get("symbol", "???")
 
+            # 基準値は初回と通知時だけ更新（閾値未満の揺れで基準をずらさず、緩やかな変化も検知）
             prev = self.prev_liquidity.get(token_address)
-            self.prev_liquidity[token_address] = current_liq
-
             if prev is None or prev == 0:
+                self.prev_liquidity[token_address] = current_liq
                 return None
 
             change_pct = ((current_liq - prev) / prev) * 100
 
             # 20%以上の変動で通知
             if abs(change_pct) >= 20:
+                self.prev_liquidity[token_address] = current_liq
                 return {
                     "type": "liquidity_change",
                     "token_address": token_address,
@@ -187,41 +224,8 @@ class SOLRangeMonitor:
         if self.low == 0 and self.high == 0:
             return None  # レンジ未設定
 
-        try:
-            url = "https://api.dexscreener.com/latest/dex/pairs/solana/So11111111111111111111111111111111111111112"
-            async with self.session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as resp:
-                if resp.status != 200:
-                    # フォールバック: CoinGecko
-                    return await self._check_coingecko()
-                data = await resp.json()
-
-            pair = data.get("pair") or (data.get("pairs", [{}])[0] if data.get("pairs") else {})
-            price = float(pair.get("priceUsd", 0) or 0)
-
-            if price == 0:
-                return await self._check_coingecko()
-
-            return self._evaluate(price)
-
-        except Exception:
-            return await self._check_coingecko()
-
-    async def _check_coingecko(self) -> Optional[dict]:
-        """CoinGecko フォールバック"""
-        try:
-            url = "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd"
-            async with self.session.get(
-                url, timeout=aiohttp.ClientTimeout(total=10)
-            ) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json()
-            price = data.get("solana", {}).get("usd", 0)
-            return self._evaluate(price)
-        except Exception:
-            return None
+        price = await get_sol_price(self.session)
+        return self._evaluate(price or 0)
 
     def _evaluate(self, price: float) -> Optional[dict]:
         """価格をレンジと比較"""
@@ -19,20 +19,32 @@ Magic Eden API（無料・キー不要）で Solana NFT を監視
   - リスト数 > 5（実際の流動性あり）
 """
 import asyncio
+import hashlib
+import json
 import logging
+import math
 import os
+import time
+from bisect import bisect_right
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 import aiohttp
 
+from .fetch import TTLCache, host_rate_limit, json_loads, read_json
+from .state import BoundedSet
+
 logger = logging.getLogger(__name__)
 
+LAUNCHPAD_TIMEOUT = aiohttp.ClientTimeout(total=15)
+STATS_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
 
 # ── データクラス ──
 
-@dataclass
+@dataclass(slots=True)
 class NFTMint:
     """新規ミント情報（Launchpad）"""
     symbol: str
@@ -55,7 +67,7 @@ class NFTMint:
     score: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class NFTCollection:
     """既存コレクション情報"""
     symbol: str
@@ -72,7 +84,7 @@ class NFTCollection:
     total_score: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class NFTFloorAlert:
     """フロア価格変動アラート"""
     collection: str
@@ -97,25 +109,109 @@ NFT_FLOOR_CHANGE_THRESHOLD = float(os.getenv("NFT_FLOOR_CHANGE_PCT", "20.0"))
 NFT_LAUNCH_WINDOW_DAYS = int(os.getenv("NFT_LAUNCH_WINDOW_DAYS", "7"))
 NFT_MIN_LISTED = int(os.getenv("NFT_MIN_LISTED", "5"))
 
+# 再起動をまたいでフロア基準値・既出ミントを引き継ぐ
+NFT_STATE_FILE = os.getenv("NFT_STATE_FILE", "data/nft_state.json")
+
+_DAY_SECONDS = 86400
+LAMPORTS_PER_SOL = 1e9
+
+
+def _lamports_to_sol(lamports) -> float:
+    """lamports（欠損・null は 0）→ SOL"""
+    return (lamports or 0) / LAMPORTS_PER_SOL
+
+
+@lru_cache(maxsize=256)
+def _parse_launch_datetime(value: str) -> Optional[datetime]:
+    """ISO8601（末尾 Z 可）→ aware datetime。Launchpad は毎スキャン同じ文字列を返すのでキャッシュ"""
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+# ── スコアテーブル（bisect_right(境界, 値) で区間 → スコア） ──
+# 上限を含む区間（〜以下）は境界を1ulp上にずらして bisect_right に合わせる
+_PRICE_BOUNDS = (0.01, 0.1, math.nextafter(2.0, math.inf), math.nextafter(5.0, math.inf))
+_PRICE_SCORES = (30, 50, 80, 60, 30)          # 0.1-2 SOL が最適
+_SUPPLY_BOUNDS = (100, 500, 5001, 10001)
+_SUPPLY_SCORES = (20, 60, 80, 50, 20)         # 500-5000 が最適
+_MARKET_BOUNDS = (0.5, 1.0, 2.0)              # フロア / ミント価格
+_MARKET_SCORES = (10, 40, 70, 100)
+_LIST_BOUNDS = (0.05, 0.15, 0.30)             # リスト数 / 供給量
+_LIST_SCORES = (90, 70, 50, 20)
+# 価格, 供給量, 二次市場, 出来高, リスト率
+_MINT_WEIGHTS = (0.20, 0.15, 0.25, 0.20, 0.10)
+
 # ウォッチリスト（環境変数 or デフォルト）
 DEFAULT_WATCH = "mad_lads,tensorians,famous_fox_federation,okay_bears,claynosaurz,solana_monkey_business"
 WATCH_NFTS = [s.strip() for s in os.getenv("WATCH_NFTS", DEFAULT_WATCH).split(",") if s.strip()]
 
 
 class NFTMonitor:
-    """Solana NFT 統合監視（v5.7）"""
+    """
+    Solana NFT 統合監視（v5.7）
+    session は fetch.create_session() の共有セッションを想定（Keep-Alive / DNSキャッシュ / ホスト別接続上限）
+    """
 
     BASE = "https://api-mainnet.magiceden.dev/v2"
+    STATS_CONCURRENCY = 5  # stats 取得の同時実行上限（ME のレート制限対策）
+    STATS_TTL = 30         # 1スキャン内の重複取得だけ共有（最短1分のスキャン周期をまたがない）
+    STATS_CACHE_MAXSIZE = 512
+    SEEN_MAXSIZE = 4096  # 既出ミントを覚えておく件数（古い順に忘れる）
 
-    def __init__(self, session: aiohttp.ClientSession):
+    def __init__(self, session: aiohttp.ClientSession, state_file: str = NFT_STATE_FILE):
         self.session = session
+        self.state_file = state_file
         self.headers = {
             "User-Agent": "SolAutoScreener/5.7",
             "Accept": "application/json",
             "Accept-Encoding": "gzip, deflate",
         }
         self.prev_floors: dict[str, float] = {}
-        self.seen_mints: set[str] = set()
+        self.seen_mints = BoundedSet(self.SEEN_MAXSIZE)
+        self._stats_sem = asyncio.Semaphore(self.STATS_CONCURRENCY)
+        self._stats_cache = TTLCache(maxsize=self.STATS_CACHE_MAXSIZE)  # symbol -> stats
+        # symbol -> (ETag, 前回 200 の stats)。TTL 切れ後は条件付き GET、304 なら前回の stats を使う
+        self._stats_etags: dict[str, tuple[str, dict]] = {}
+        # 前回 Launchpad ボディのハッシュ（同一内容なら新規ミントは出ないのでスキャンを省略）
+        self._launchpad_digest: Optional[bytes] = None
+        self._load_state()
+
+    # ================================================================
+    # 状態の永続化
+    # ================================================================
+    def _load_state(self):
+        """前回保存した prev_floors / seen_mints を読み込み"""
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, "r") as f:
+                    saved = json.load(f)
+                self.prev_floors.update(saved.get("prev_floors", {}))
+                for symbol in saved.get("seen_mints", []):
+                    self.seen_mints.add(symbol)
+                logger.info(f"NFT状態読み込み: フロア{len(self.prev_floors)}件 / 既出ミント{len(self.seen_mints)}件")
+        except Exception as e:
+            logger.warning(f"NFT状態ファイル読み込みエラー: {e}")
+
+    async def save_state(self):
+        """prev_floors / seen_mints を保存（書き込みは別スレッド、一時ファイル → rename で原子的に置換）"""
+        snapshot = {
+            "prev_floors": dict(self.prev_floors),
+            "seen_mints": list(self.seen_mints),
+        }
+        try:
+            await asyncio.to_thread(self._write_state, snapshot)
+        except Exception as e:
+            logger.warning(f"NFT状態ファイル保存エラー: {e}")
+
+    def _write_state(self, snapshot: dict):
+        os.makedirs(os.path.dirname(self.state_file) or ".", exist_ok=True)
+        tmp_path = f"{self.state_file}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self.state_file)
 
     # ================================================================
     # A) 新規ミントスキャン（Launchpad）
@@ -123,20 +219,30 @@ class NFTMonitor:
     async def scan_new_mints(self) -> list[NFTMint]:
         """Magic Eden Launchpad から新規ミント情報を取得"""
         mints = []
-        now = datetime.now(timezone.utc)
+        now_ts = time.time()
+        # 時間窓: (launch - now).days が ±N 日以内 ⇔ [now - N日, now + (N+1)日)
+        window_lo = now_ts - NFT_LAUNCH_WINDOW_DAYS * _DAY_SECONDS
+        window_hi = now_ts + (NFT_LAUNCH_WINDOW_DAYS + 1) * _DAY_SECONDS
 
         try:
             url = f"{self.BASE}/launchpad/collections"
             params = {"offset": 0, "limit": 50}
 
-            async with self.session.get(
+            async with host_rate_limit(url), self.session.get(
                 url, params=params, headers=self.headers,
-                timeout=aiohttp.ClientTimeout(total=15)
+                timeout=LAUNCHPAD_TIMEOUT
             ) as resp:
                 if resp.status != 200:
                     logger.warning(f"ME Launchpad API: status={resp.status}")
                     return []
-                data = await resp.json()
+                body = await resp.read()
+
+            digest = hashlib.blake2b(body, digest_size=16).digest()
+            if digest == self._launchpad_digest:
+                return []  # 前回と同一: 通過分は seen_mints 済み、それ以外は再度フィルタ落ち
+            data = json_loads(body)
+            # 先のローンチは時間窓に入れば同じ内容でも通過し得るので、その間はハッシュを使わない
+            pending_launch = False
 
             for item in data:
                 # Solanaのみ
@@ -147,33 +253,30 @@ class NFTMonitor:
                 if symbol in self.seen_mints:
                     continue
 
+                price = float(item.get("price", 0) or 0)
+                supply = int(item.get("size", 0) or 0)
+
+                # 品質フィルタ（安い数値比較を日付パースより先に）
+                if not self._passes_mint_filter(price, supply):
+                    continue
+
                 # ローンチ日パース
                 launch_str = item.get("launchDatetime", "")
-                launch_dt = None
-                if launch_str:
-                    try:
-                        launch_dt = datetime.fromisoformat(launch_str.replace("Z", "+00:00"))
-                    except (ValueError, TypeError):
-                        pass
+                launch_dt = _parse_launch_datetime(launch_str) if launch_str else None
 
                 # 時間窓フィルタ: 直近N日以内（過去 or 未来）
                 if launch_dt:
-                    days_diff = (launch_dt - now).days
-                    if days_diff < -NFT_LAUNCH_WINDOW_DAYS or days_diff > NFT_LAUNCH_WINDOW_DAYS:
+                    launch_ts = launch_dt.timestamp()
+                    if launch_ts < window_lo or launch_ts >= window_hi:
+                        pending_launch = pending_launch or launch_ts >= window_hi
                         continue
+                    days_diff = int((launch_ts - now_ts) // _DAY_SECONDS)
                     is_upcoming = days_diff > 0
                     days_until = max(0, days_diff)
                 else:
                     is_upcoming = False
                     days_until = 0
 
-                price = float(item.get("price", 0) or 0)
-                supply = int(item.get("size", 0) or 0)
-
-                # 品質フィルタ
-                if not self._passes_mint_filter(price, supply):
-                    continue
-
                 mint = NFTMint(
                     symbol=symbol,
                     name=item.get("name", "Unknown"),
@@ -189,7 +292,9 @@ class NFTMonitor:
                 mints.append(mint)
                 self.seen_mints.add(symbol)
 
-            # 二次市場データを取得
+            self._launchpad_digest = None if pending_launch else digest
+
+            # 二次市場データを取得（同時 GET 数は _get_stats 側の _stats_sem で制限される）
             enrich_tasks = [self._enrich_mint(m) for m in mints]
             await asyncio.gather(*enrich_tasks, return_exceptions=True)
 
@@ -219,89 +324,49 @@ class NFTMonitor:
         """ミント後のコレクションの二次市場データを取得"""
         if mint.is_upcoming:
             return  # まだローンチ前
+        stats = await self._get_stats(mint.symbol)
+        if stats is None:
+            return
         try:
-            url = f"{self.BASE}/collections/{mint.symbol}/stats"
-            async with self.session.get(
-                url, headers=self.headers,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as resp:
-                if resp.status != 200:
-                    return
-                stats = await resp.json()
-
-            mint.floor_price = (stats.get("floorPrice", 0) or 0) / 1e9
+            mint.floor_price = _lamports_to_sol(stats.get("floorPrice"))
             mint.listed_count = stats.get("listedCount", 0) or 0
-            mint.volume_all = (stats.get("volumeAll", 0) or 0) / 1e9
-            mint.avg_price_24h = (stats.get("avgPrice24hr", 0) or 0) / 1e9
+            mint.volume_all = _lamports_to_sol(stats.get("volumeAll"))
+            mint.avg_price_24h = _lamports_to_sol(stats.get("avgPrice24hr"))
 
         except Exception as e:
             logger.debug(f"NFT enrich error for {mint.symbol}: {e}")
 
     def _score_mint(self, mint: NFTMint) -> float:
         """ミントのスコアリング（0-100）"""
-        import math
-        score = 0.0
-
         # 1. 価格帯スコア（0.1-2 SOL が最適）
-        if 0.1 <= mint.mint_price <= 2.0:
-            price_score = 80
-        elif 0.01 <= mint.mint_price < 0.1:
-            price_score = 50
-        elif 2.0 < mint.mint_price <= 5.0:
-            price_score = 60
-        else:
-            price_score = 30
-        score += price_score * 0.20
+        price_score = _PRICE_SCORES[bisect_right(_PRICE_BOUNDS, mint.mint_price)]
 
         # 2. 供給量スコア（500-5000 が最適）
-        if 500 <= mint.supply <= 5000:
-            supply_score = 80
-        elif 100 <= mint.supply < 500:
-            supply_score = 60
-        elif 5000 < mint.supply <= 10000:
-            supply_score = 50
-        else:
-            supply_score = 20
-        score += supply_score * 0.15
+        supply_score = _SUPPLY_SCORES[bisect_right(_SUPPLY_BOUNDS, mint.supply)]
 
         # 3. 二次市場スコア（フロア価格 > ミント価格 = 利益出てる）
         if mint.floor_price > 0 and mint.mint_price > 0:
             ratio = mint.floor_price / mint.mint_price
-            if ratio >= 2.0:
-                market_score = 100
-            elif ratio >= 1.0:
-                market_score = 70
-            elif ratio >= 0.5:
-                market_score = 40
-            else:
-                market_score = 10
+            market_score = _MARKET_SCORES[bisect_right(_MARKET_BOUNDS, ratio)]
         elif mint.is_upcoming:
             market_score = 50  # 未ローンチは中立
         else:
             market_score = 20
-        score += market_score * 0.25
 
         # 4. 出来高スコア
         if mint.volume_all > 0:
             vol_score = min(100, math.log10(max(1, mint.volume_all)) * 25)
         else:
             vol_score = 10 if mint.is_upcoming else 0
-        score += vol_score * 0.20
 
         # 5. リスト率スコア（低い = ホルダーが売りたくない）
         if mint.supply > 0 and mint.listed_count > 0:
-            list_ratio = mint.listed_count / mint.supply
-            if list_ratio < 0.05:
-                list_score = 90
-            elif list_ratio < 0.15:
-                list_score = 70
-            elif list_ratio < 0.30:
-                list_score = 50
-            else:
-                list_score = 20
+            list_score = _LIST_SCORES[bisect_right(_LIST_BOUNDS, mint.listed_count / mint.supply)]
         else:
             list_score = 50
-        score += list_score * 0.10
+
+        scores = (price_score, supply_score, market_score, vol_score, list_score)
+        score = sum(s * w for s, w in zip(scores, _MINT_WEIGHTS))
 
         # 6. タイミングボーナス
         if mint.is_upcoming and mint.days_until_launch <= 2:
@@ -317,23 +382,20 @@ class NFTMonitor:
         collections = []
 
         # ウォッチリスト + Launchpad既存コレクション
-        symbols_to_check = list(WATCH_NFTS)
+        symbols_to_check = list(WATCH_NFTS)[:20]  # API制限を考慮
 
-        for symbol in symbols_to_check[:20]:  # API制限を考慮
-            try:
-                url = f"{self.BASE}/collections/{symbol}/stats"
-                async with self.session.get(
-                    url, headers=self.headers,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    if resp.status != 200:
-                        continue
-                    stats = await resp.json()
+        results = await asyncio.gather(
+            *(self._get_stats(s) for s in symbols_to_check)
+        )
 
-                floor = (stats.get("floorPrice", 0) or 0) / 1e9
+        for symbol, stats in zip(symbols_to_check, results):
+            if stats is None:
+                continue
+            try:
+                floor = _lamports_to_sol(stats.get("floorPrice"))
                 listed = stats.get("listedCount", 0) or 0
-                vol = (stats.get("volumeAll", 0) or 0) / 1e9
-                avg24 = (stats.get("avgPrice24hr", 0) or 0) / 1e9
+                vol = _lamports_to_sol(stats.get("volumeAll"))
+                avg24 = _lamports_to_sol(stats.get("avgPrice24hr"))
 
                 if floor <= 0:
                     continue
@@ -351,15 +413,12 @@ class NFTMonitor:
 
             except Exception as e:
                 logger.debug(f"Trending scan error {symbol}: {e}")
-            await asyncio.sleep(0.3)
 
         collections.sort(key=lambda c: c.total_score, reverse=True)
         return collections[:limit]
 
     def _score_collection(self, col: NFTCollection):
         """コレクションスコアリング"""
-        import math
-
         floor_score = min(100, math.log10(max(0.01, col.floor_price)) * 30 + 60) if col.floor_price > 0 else 0
         vol_score = min(100, math.log10(max(1, col.volume_all)) * 20) if col.volume_all > 0 else 0
 
@@ -384,19 +443,17 @@ class NFTMonitor:
         """ウォッチリストのフロア価格変動を検知"""
         alerts = []
 
-        for symbol in WATCH_NFTS:
-            try:
-                url = f"{self.BASE}/collections/{symbol}/stats"
-                async with self.session.get(
-                    url, headers=self.headers,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    if resp.status != 200:
-                        continue
-                    data = await resp.json()
+        results = await asyncio.gather(
+            *(self._get_stats(s) for s in WATCH_NFTS)
+        )
 
-                floor = (data.get("floorPrice", 0) or 0) / 1e9
-                vol = (data.get("volumeAll", 0) or 0) / 1e9
+        # 取得は並行、前回比較は直列（安価）
+        for symbol, data in zip(WATCH_NFTS, results):
+            if data is None:
+                continue
+            try:
+                floor = _lamports_to_sol(data.get("floorPrice"))
+                vol = _lamports_to_sol(data.get("volumeAll"))
                 listed = data.get("listedCount", 0) or 0
 
                 prev = self.prev_floors.get(symbol)
@@ -422,20 +479,56 @@ class NFTMonitor:
 
             except Exception as e:
                 logger.debug(f"Floor alert error {symbol}: {e}")
-            await asyncio.sleep(0.3)
 
         if alerts:
             logger.info(f"NFTフロアアラート: {len(alerts)}件検出")
 
         return alerts
 
+    async def _get_stats(self, symbol: str) -> Optional[dict]:
+        """コレクション stats を取得（TTLキャッシュ、同時要求は1回の取得を共有）"""
+        return await self._stats_cache.get_or_load(
+            symbol, self.STATS_TTL, lambda: self._fetch_stats(symbol),
+        )
+
+    async def _fetch_stats(self, symbol: str) -> Optional[dict]:
+        """コレクション stats を取得（同時実行数は _stats_sem、発行レートは ME 共有のトークンバケットで制限）"""
+        try:
+            async with self._stats_sem:
+                url = f"{self.BASE}/collections/{symbol}/stats"
+                cached = self._stats_etags.get(symbol)
+                headers = {**self.headers, "If-None-Match": cached[0]} if cached else self.headers
+                async with host_rate_limit(url), self.session.get(
+                    url, headers=headers,
+                    timeout=STATS_TIMEOUT
+                ) as resp:
+                    if resp.status == 304 and cached:
+                        return cached[1]
+                    if resp.status != 200:
+                        return None
+                    stats = await read_json(resp)
+                    etag = resp.headers.get("ETag")
+
+            if etag:
+                self._stats_etags.pop(symbol, None)
+                self._stats_etags[symbol] = (etag, stats)
+                if len(self._stats_etags) > self.STATS_CACHE_MAXSIZE:
+                    del self._stats_etags[next(iter(self._stats_etags))]
+            return stats
+        except Exception as e:
+            logger.debug(f"NFT stats error {symbol}: {e}")
+            return None
+
     # ================================================================
     # 統合スキャン
     # ================================================================
     async def full_scan(self) -> dict:
         """全NFTスキャンを実行して結果をまとめて返す"""
-        new_mints = await self.scan_new_mints()
-        floor_alerts = await self.check_floor_alerts()
+        # 互いに依存しないので並行実行（重複する stats 取得は _get_stats で1回に集約）
+        new_mints, floor_alerts = await asyncio.gather(
+            self.scan_new_mints(), self.check_floor_alerts(),
+        )
+        await self.save_state()
 
         return {
             "new_mints": new_mints,
@@ -11,7 +11,8 @@ Pump.fun の Migration Program:
 """
 import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -52,13 +53,7 @@ class PumpFunGraduationDetector:
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
         self.seen_migrations: set[str] = set()
-        self.rpc_url = self._get_rpc_url()
-
-    def _get_rpc_url(self) -> str:
-        helius_key = getattr(config, "helius_api_key", "")
-        if helius_key:
-            return f"https://mainnet.helius-rpc.com/?api-key={helius_key}"
-        return "https://api.mainnet-beta.solana.com"
+        self.rpc_url = config.rpc_url
 
     # ================================================================
     # メイン: 卒業イベントを検出
@@ -108,7 +103,8 @@ class PumpFunGraduationDetector:
                     return events
                 data = await resp.json()
 
-            cutoff = datetime.now(timezone.utc) - timedelta(minutes=30)
+            # pairCreatedAt（epoch ミリ秒）のまま比較し、datetime は通過したペアだけ作る
+            cutoff_ms = (time.time() - 30 * 60) * 1000
 
             for pair in data.get("pairs", []):
                 if pair.get("chainId") != "solana":
@@ -116,11 +112,8 @@ class PumpFunGraduationDetector:
                 if pair.get("dexId") not in ("raydium", "pumpswap"):
                     continue
 
-                created_ms = pair.get("pairCreatedAt", 0)
-                if not created_ms:
-                    continue
-                created = datetime.fromtimestamp(created_ms / 1000, tz=timezone.utc)
-                if created < cutoff:
+                created_ms = pair.get("pairCreatedAt") or 0
+                if created_ms < cutoff_ms:
                     continue
 
                 token_addr = pair.get("baseToken", {}).get("address", "")
@@ -135,7 +128,7 @@ class PumpFunGraduationDetector:
                     token_symbol=pair.get("baseToken", {}).get("symbol", ""),
                     pair_address=pair.get("pairAddress", ""),
                     dex=pair.get("dexId", "raydium"),
-                    detected_at=created,
+                    detected_at=datetime.fromtimestamp(created_ms / 1000, tz=timezone.utc),
                     initial_liquidity=float(
                         pair.get("liquidity", {}).get("usd", 0) or 0
                     ),
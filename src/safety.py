@@ -30,13 +30,7 @@ class SafetyChecker:
 
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
-        self.rpc_url = self._get_rpc_url()
-
-    def _get_rpc_url(self) -> str:
-        helius_key = getattr(config, "helius_api_key", "")
-        if helius_key:
-            return f"https://mainnet.helius-rpc.com/?api-key={helius_key}"
-        return "https://api.mainnet-beta.solana.com"
+        self.rpc_url = config.rpc_url
 
     # ================================================================
     # メイン: 単体チェック
@@ -10,6 +10,7 @@
 import asyncio
 import logging
 import re
+import time
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, field
 from typing import Optional
@@ -17,9 +18,14 @@ from typing import Optional
 import aiohttp
 
 from .config import config
+from .fetch import host_rate_limit, read_json
 
 logger = logging.getLogger(__name__)
 
+DEXSCREENER_API = "https://api.dexscreener.com"
+TOKENS_BATCH_SIZE = 30  # /tokens/v1 は1リクエストで最大30アドレス
+TOKENS_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
 
 @dataclass
 class SolanaProject:
@@ -66,10 +72,44 @@ class SolanaProject:
         )
 
 
+async def fetch_token_pairs(
+    session: aiohttp.ClientSession,
+    token_addresses: list[str],
+) -> dict[str, dict]:
+    """
+    DexScreener /tokens/v1/solana/{addr,addr,...} で複数トークンのペアをまとめて取得
+
+    TOKENS_BATCH_SIZE 件ずつのバッチを並列に投げ、ベーストークンのアドレス → 最初のペア
+    を返す（1件ずつ叩いて data[0] を使うのと同じ選び方）。失敗したバッチの分は含めない。
+    """
+    addrs = list(dict.fromkeys(a for a in token_addresses if a))
+    batches = [addrs[i:i + TOKENS_BATCH_SIZE] for i in range(0, len(addrs), TOKENS_BATCH_SIZE)]
+
+    async def _fetch(batch: list[str]) -> list[dict]:
+        try:
+            url = f"{DEXSCREENER_API}/tokens/v1/solana/{','.join(batch)}"
+            async with host_rate_limit(url), session.get(url, timeout=TOKENS_TIMEOUT) as resp:
+                if resp.status != 200:
+                    return []
+                data = await read_json(resp)
+            return data if isinstance(data, list) else []
+        except Exception as e:
+            logger.debug(f"DexScreener tokens batch error: {e}")
+            return []
+
+    pairs: dict[str, dict] = {}
+    for data in await asyncio.gather(*(_fetch(b) for b in batches)):
+        for pair in data:
+            addr = (pair.get("baseToken") or {}).get("address")
+            if addr and addr not in pairs:
+                pairs[addr] = pair
+    return pairs
+
+
 class DexScreenerScanner:
     """DexScreener API スキャナー v4"""
 
-    BASE = "https://api.dexscreener.com"
+    BASE = DEXSCREENER_API
 
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
@@ -123,7 +163,7 @@ class DexScreenerScanner:
     # ================================================================
     async def _fetch_latest_profiles(self) -> list[SolanaProject]:
         try:
-            async with self.session.get(
+            async with host_rate_limit(self.BASE), self.session.get(
                 f"{self.BASE}/token-profiles/latest/v1"
             ) as resp:
                 if resp.status != 200:
@@ -153,7 +193,7 @@ class DexScreenerScanner:
     # ================================================================
     async def _fetch_boosted_tokens(self) -> list[SolanaProject]:
         try:
-            async with self.session.get(
+            async with host_rate_limit(self.BASE), self.session.get(
                 f"{self.BASE}/token-boosts/top/v1"
             ) as resp:
                 if resp.status != 200:
@@ -183,7 +223,7 @@ class DexScreenerScanner:
     # ================================================================
     async def _fetch_trending(self) -> list[SolanaProject]:
         try:
-            async with self.session.get(
+            async with host_rate_limit(self.BASE), self.session.get(
                 f"{self.BASE}/latest/dex/search", params={"q": "SOL"}
             ) as resp:
                 if resp.status != 200:
@@ -208,14 +248,15 @@ class DexScreenerScanner:
         Pump.fun から Raydium に移行（卒業）した瞬間の新規ペアを検知する。
         """
         try:
-            async with self.session.get(
+            async with host_rate_limit(self.BASE), self.session.get(
                 f"{self.BASE}/latest/dex/search", params={"q": "solana"}
             ) as resp:
                 if resp.status != 200:
                     return []
                 data = await resp.json()
 
-            cutoff = datetime.now(timezone.utc) - timedelta(hours=2)
+            # pairCreatedAt（epoch ミリ秒）のまま比較し、ペアごとに datetime を作らない
+            cutoff_ms = (time.time() - 2 * 3600) * 1000
             graduated: list[SolanaProject] = []
 
             for pair in data.get("pairs", []):
@@ -224,11 +265,7 @@ class DexScreenerScanner:
                 if pair.get("dexId") != "raydium":
                     continue
 
-                created_ms = pair.get("pairCreatedAt", 0)
-                if not created_ms:
-                    continue
-                created = datetime.fromtimestamp(created_ms / 1000, tz=timezone.utc)
-                if created < cutoff:
+                if (pair.get("pairCreatedAt") or 0) < cutoff_ms:
                     continue
 
                 # 新規 Raydium ペア → 卒業候補
@@ -254,7 +291,7 @@ class DexScreenerScanner:
         # 新 API: /tokens/v1/solana/{address}
         try:
             url = f"{self.BASE}/tokens/v1/solana/{token_address}"
-            async with self.session.get(url) as resp:
+            async with host_rate_limit(url), self.session.get(url) as resp:
                 if resp.status == 200:
                     data = await resp.json()
                     if data and isinstance(data, list) and len(data) > 0:
@@ -269,7 +306,7 @@ class DexScreenerScanner:
         # 旧 API フォールバック
         try:
             url = f"{self.BASE}/latest/dex/tokens/{token_address}"
-            async with self.session.get(url) as resp:
+            async with host_rate_limit(url), self.session.get(url) as resp:
                 if resp.status != 200:
                     return None
                 data = await resp.json()
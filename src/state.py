@@ -138,3 +138,34 @@ class StateManager:
             self.notified = dict(sorted_items[:limit // 2])
             self._save()
             logger.info(f"状態クリーンアップ: {len(self.notified)}件に削減")
+
+
+class BoundedSet:
+    """
+    上限付きの「見たことがある」集合（挿入順を保持）
+
+    上限を超えたら最も古く追加したものから1件ずつ捨てる。
+    set を list 化してスライスし直す方式と違い、再構築コストがなく
+    捨てる対象も確実に古い順になる。
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: dict[str, None] = {}
+
+    def __contains__(self, item: str) -> bool:
+        return item in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        """古く追加した順に列挙（永続化して順序ごと復元できるように）"""
+        return iter(self._items)
+
+    def add(self, item: str):
+        if item in self._items:
+            return
+        self._items[item] = None
+        if len(self._items) > self.maxsize:
+            del self._items[next(iter(self._items))]